@@ -2,13 +2,28 @@
 
 from __future__ import annotations
 
-import shutil
 from abc import ABC, abstractmethod
 
-from dockcheck.agents.dispatch import AgentDispatcher
+from dockcheck.agents.dispatch import AgentDispatcher, _resolve_binary
 from dockcheck.agents.schemas import AgentResult
 
 
+def clear_availability_cache() -> None:
+    """Forget cached PATH lookups (e.g. after installing a CLI, or in tests)."""
+    _resolve_binary.cache_clear()
+
+
+_DEFAULT_DISPATCHER: AgentDispatcher | None = None
+
+
+def _get_default_dispatcher() -> AgentDispatcher:
+    """Return the process-wide dispatcher shared by adapters built without one."""
+    global _DEFAULT_DISPATCHER
+    if _DEFAULT_DISPATCHER is None:
+        _DEFAULT_DISPATCHER = AgentDispatcher()
+    return _DEFAULT_DISPATCHER
+
+
 class AgentAdapter(ABC):
     """Abstract base class for agent adapters.
 
@@ -57,11 +72,11 @@ class ClaudeAdapter(AgentAdapter):
     """
 
     def __init__(self, dispatcher: AgentDispatcher | None = None) -> None:
-        self._dispatcher = dispatcher or AgentDispatcher()
+        self._dispatcher = dispatcher or _get_default_dispatcher()
 
     def is_available(self) -> bool:
         """Return ``True`` if the ``claude`` binary is on PATH."""
-        return shutil.which("claude") is not None
+        return _resolve_binary("claude") is not None
 
     async def run(
         self,
@@ -105,11 +120,11 @@ class CodexAdapter(AgentAdapter):
         dispatcher: AgentDispatcher | None = None,
     ) -> None:
         self._approval_mode = approval_mode
-        self._dispatcher = dispatcher or AgentDispatcher()
+        self._dispatcher = dispatcher or _get_default_dispatcher()
 
     def is_available(self) -> bool:
         """Return ``True`` if the ``codex`` binary is on PATH."""
-        return shutil.which("codex") is not None
+        return _resolve_binary("codex") is not None
 
     async def run(
         self,
@@ -3,20 +3,168 @@
 from __future__ import annotations
 
 import asyncio
+import contextlib
+import functools
 import json
 import logging
-from typing import Any
+import os
+import re
+import shutil
+from collections.abc import Coroutine
+from typing import Any, TypeVar
 
-from dockcheck.agents.schemas import AgentResult
+from dockcheck.agents.schemas import AgentResult, Finding, FindingSeverity
 
 logger = logging.getLogger(__name__)
 
+_T = TypeVar("_T")
+
+# Hard cap on agent stdout; a runaway CLI is killed rather than buffered.
+MAX_STDOUT_BYTES = 8 * 1024 * 1024
+_READ_CHUNK_BYTES = 64 * 1024
+
+# Opening ``` fence (with optional language tag) up to the next fence line or
+# end of text — an unterminated fence keeps everything after the opener.
+_FENCE_RE = re.compile(r"```[^\n]*\n?(.*?)(?:^```|\Z)", re.DOTALL | re.MULTILINE)
+
+
+def run_event_loop(main: Coroutine[Any, Any, _T]) -> _T:
+    """Run *main* to completion, on uvloop when ``DOCKCHECK_UVLOOP=1``.
+
+    Falls back to :func:`asyncio.run` when the flag is unset or uvloop is
+    not installed.  Only the new loop uses uvloop; the process-wide event
+    loop policy is never replaced.
+    """
+    if os.environ.get("DOCKCHECK_UVLOOP") == "1":
+        try:
+            import uvloop
+        except ImportError:
+            logger.debug("DOCKCHECK_UVLOOP=1 but uvloop is not installed")
+        else:
+            return uvloop.run(main)
+    return asyncio.run(main)
+
 
 class DispatchError(Exception):
     """Raised when agent dispatch fails with a non-recoverable error."""
 
 
-def _parse_claude_output(raw: str, stderr: str = "") -> AgentResult:
+class _OutputTooLargeError(Exception):
+    """Internal signal: the subprocess exceeded :data:`MAX_STDOUT_BYTES`."""
+
+
+@functools.cache
+def _resolve_binary(name: str) -> str | None:
+    """Return the absolute path of *name* on PATH, or ``None`` if missing.
+
+    Memoized so repeated spawns skip the PATH walk ``execvp`` would do.
+    """
+    return shutil.which(name)
+
+
+@functools.lru_cache(maxsize=8)
+def _claude_flags(output_format: str) -> tuple[str, ...]:
+    """Static leading flags for a headless ``claude`` invocation."""
+    return ("--print", "--output-format", output_format)
+
+
+@functools.lru_cache(maxsize=8)
+def _codex_flags(approval_mode: str) -> tuple[str, ...]:
+    """Static leading flags for a quiet ``codex`` invocation."""
+    return ("--quiet", "--approval-mode", approval_mode)
+
+
+def _require_binary(name: str) -> str:
+    """Resolve *name* via :func:`_resolve_binary` or raise :class:`DispatchError`."""
+    path = _resolve_binary(name)
+    if path is None:
+        raise DispatchError(
+            f"{name} CLI not found. Ensure '{name}' is installed and on PATH."
+        )
+    return path
+
+
+async def _kill(proc: asyncio.subprocess.Process) -> None:
+    """Kill *proc* and reap it; a process that already exited is fine."""
+    with contextlib.suppress(ProcessLookupError):
+        proc.kill()
+    await proc.wait()
+
+
+def _as_text(data: str | bytes) -> str:
+    """Decode subprocess bytes leniently; pass ``str`` through unchanged."""
+    if isinstance(data, bytes):
+        return data.decode("utf-8", errors="replace")
+    return data
+
+
+_SEVERITIES: dict[str, FindingSeverity] = {s.value: s for s in FindingSeverity}
+_ACTIONS = frozenset({"none", "retry", "escalate", None})
+
+
+def _is_number(value: object) -> bool:
+    return type(value) in (int, float)
+
+
+def _fast_finding(data: object) -> Finding | None:
+    """Construct a :class:`Finding` without validation, or ``None`` if malformed."""
+    if type(data) is not dict:
+        return None
+    raw_severity = data.get("severity")
+    severity = _SEVERITIES.get(raw_severity) if type(raw_severity) is str else None
+    message = data.get("message")
+    file_path = data.get("file_path")
+    line = data.get("line")
+    if (
+        severity is None
+        or type(message) is not str
+        or (file_path is not None and type(file_path) is not str)
+        or (line is not None and type(line) is not int)
+    ):
+        return None
+    return Finding.model_construct(
+        severity=severity, message=message, file_path=file_path, line=line
+    )
+
+
+def _fast_build_result(data: dict[str, Any]) -> AgentResult:
+    """Build an :class:`AgentResult` from agent JSON.
+
+    Dicts that already have exactly the expected shape are assembled with
+    ``model_construct`` (no validator run); anything else — wrong types,
+    out-of-range confidence, unknown severities — goes through
+    ``model_validate`` and raises exactly as before.
+    """
+    completed = data.get("completed")
+    confidence = data.get("confidence")
+    turns_used = data.get("turns_used", 0)
+    summary = data.get("summary", "")
+    action_needed = data.get("action_needed", "none")
+    raw_findings = data.get("findings", [])
+    if (
+        type(completed) is bool
+        and _is_number(confidence)
+        and 0.0 <= confidence <= 1.0  # type: ignore[operator]
+        and type(turns_used) is int
+        and type(summary) is str
+        and (action_needed is None or type(action_needed) is str)
+        and action_needed in _ACTIONS
+        and type(raw_findings) is list
+    ):
+        findings = [_fast_finding(f) for f in raw_findings]
+        if None not in findings:
+            return AgentResult.model_construct(
+                completed=completed,
+                confidence=float(confidence),  # type: ignore[arg-type]
+                turns_used=turns_used,
+                summary=summary,
+                findings=findings,
+                action_needed=action_needed,
+            )
+    return AgentResult.model_validate(data)
+
+
+def _parse_claude_output(raw: str | bytes, stderr: str = "") -> AgentResult:
     """Parse the JSON output from ``claude -p --output-format json``.
 
     Claude Code's ``--output-format json`` wraps the model's response in an
@@ -27,6 +175,9 @@ def _parse_claude_output(raw: str, stderr: str = "") -> AgentResult:
     We attempt to JSON-parse the inner ``result`` value first.  If that fails
     we fall back to treating the full output as a plain-text summary and
     synthesising a minimal ``AgentResult`` with a best-effort confidence.
+
+    ``raw`` may be the undecoded subprocess stdout — ``json.loads`` accepts
+    bytes, so the full buffer is only decoded when falling back to text.
     """
     raw = raw.strip()
     if not raw:
@@ -39,18 +190,18 @@ def _parse_claude_output(raw: str, stderr: str = "") -> AgentResult:
     # --- Try to parse outer envelope -----------------------------------------
     try:
         envelope = json.loads(raw)
-    except json.JSONDecodeError:
-        # Raw output is not JSON at all — treat as plain summary text.
+    except ValueError:
+        # Raw output is not JSON (or not valid UTF-8) — treat as plain text.
         return AgentResult(
             completed=True,
             confidence=0.5,
-            summary=raw[:500],
+            summary=_as_text(raw[:500]),
         )
 
     # If the envelope *is* an AgentResult-shaped dict, use it directly.
     if isinstance(envelope, dict) and "completed" in envelope:
         try:
-            return AgentResult.model_validate(envelope)
+            return _fast_build_result(envelope)
         except Exception:
             pass
 
@@ -59,42 +210,33 @@ def _parse_claude_output(raw: str, stderr: str = "") -> AgentResult:
     if isinstance(envelope, dict):
         inner_text = str(envelope.get("result", envelope.get("content", "")))
     else:
-        inner_text = raw
+        inner_text = _as_text(raw)
 
     # Try to parse inner_text as JSON (agent was instructed to reply in JSON).
     inner_text = inner_text.strip()
     # Strip markdown code fences if present.
-    if inner_text.startswith("```"):
-        lines = inner_text.splitlines()
-        # Remove opening fence line and any trailing fence.
-        inner_lines = []
-        in_fence = False
-        for line in lines:
-            if line.startswith("```") and not in_fence:
-                in_fence = True
-                continue
-            if line.startswith("```") and in_fence:
-                break
-            if in_fence:
-                inner_lines.append(line)
-        inner_text = "\n".join(inner_lines).strip()
+    fence = _FENCE_RE.match(inner_text)
+    if fence:
+        inner_text = fence.group(1).strip()
 
-    try:
-        parsed = json.loads(inner_text)
-        if isinstance(parsed, dict) and "completed" in parsed:
-            return AgentResult.model_validate(parsed)
-    except (json.JSONDecodeError, Exception):
-        pass
+    # Only text that mentions the key can decode to an AgentResult dict.
+    if '"completed"' in inner_text:
+        try:
+            parsed = json.loads(inner_text)
+            if isinstance(parsed, dict) and "completed" in parsed:
+                return _fast_build_result(parsed)
+        except (json.JSONDecodeError, Exception):
+            pass
 
     # Last-resort: wrap inner_text as a plain summary.
     return AgentResult(
         completed=True,
         confidence=0.5,
-        summary=inner_text[:500] or raw[:500],
+        summary=inner_text[:500] or _as_text(raw[:500]),
     )
 
 
-def _parse_codex_output(raw: str, stderr: str = "") -> AgentResult:
+def _parse_codex_output(raw: str | bytes, stderr: str = "") -> AgentResult:
     """Parse output from ``codex --quiet``.
 
     Codex prints its response to stdout; with ``--quiet`` it suppresses
@@ -109,22 +251,30 @@ def _parse_codex_output(raw: str, stderr: str = "") -> AgentResult:
             summary=f"Empty response from codex. stderr={stderr[:200]}",
         )
 
-    try:
-        parsed = json.loads(raw)
-        if isinstance(parsed, dict) and "completed" in parsed:
-            return AgentResult.model_validate(parsed)
-    except (json.JSONDecodeError, Exception):
-        pass
+    marker = b'"completed"' if isinstance(raw, bytes) else '"completed"'
+    if marker in raw:
+        try:
+            parsed = json.loads(raw)
+            if isinstance(parsed, dict) and "completed" in parsed:
+                return _fast_build_result(parsed)
+        except (json.JSONDecodeError, Exception):
+            pass
 
     return AgentResult(
         completed=True,
         confidence=0.5,
-        summary=raw[:500],
+        summary=_as_text(raw[:500]),
     )
 
 
 class AgentDispatcher:
-    """Dispatches agent calls via Claude Code CLI or Codex CLI subprocesses."""
+    """Dispatches agent calls via Claude Code CLI or Codex CLI subprocesses.
+
+    Every call spawns a fresh CLI process.  Long-lived ``stream-json`` workers
+    are deliberately not pooled: a worker keeps its conversation history
+    between prompts (so one task would see another's context), and
+    ``--system-prompt`` / ``--max-turns`` are fixed per process.
+    """
 
     # ------------------------------------------------------------------
     # Claude
@@ -157,10 +307,8 @@ class AgentDispatcher:
                 non-zero exit code that we cannot recover from.
         """
         cmd = [
-            "claude",
-            "--print",
-            "--output-format",
-            output_format,
+            _require_binary("claude"),
+            *_claude_flags(output_format),
             "--max-turns",
             str(max_turns),
         ]
@@ -168,7 +316,8 @@ class AgentDispatcher:
             cmd.extend(["--system-prompt", system_prompt])
         cmd.append(prompt)
 
-        logger.debug("Dispatching Claude: %s", " ".join(cmd[:6]) + " ...")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Dispatching Claude: %s ...", " ".join(cmd[:6]))
         return await self._run_subprocess(
             cmd,
             timeout=timeout,
@@ -201,14 +350,13 @@ class AgentDispatcher:
             DispatchError: On timeout or unrecoverable subprocess failure.
         """
         cmd = [
-            "codex",
-            "--quiet",
-            "--approval-mode",
-            approval_mode,
+            _require_binary("codex"),
+            *_codex_flags(approval_mode),
             prompt,
         ]
 
-        logger.debug("Dispatching Codex: %s", " ".join(cmd[:4]) + " ...")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Dispatching Codex: %s ...", " ".join(cmd[:4]))
         return await self._run_subprocess(
             cmd,
             timeout=timeout,
@@ -251,6 +399,7 @@ class AgentDispatcher:
     async def dispatch_parallel(
         self,
         tasks: list[dict[str, Any]],
+        max_concurrent: int = 8,
     ) -> list[AgentResult]:
         """Run multiple agent calls in parallel using :func:`asyncio.gather`.
 
@@ -260,16 +409,23 @@ class AgentDispatcher:
 
         Args:
             tasks: List of task dicts, each describing one agent call.
+            max_concurrent: Maximum number of agent subprocesses alive at once.
 
         Returns:
             List of :class:`AgentResult` in the same order as ``tasks``.
         """
+        semaphore = asyncio.Semaphore(max_concurrent)
+
+        async def _run_task(agent: str, prompt: str, **kwargs: Any) -> AgentResult:
+            async with semaphore:
+                return await self.dispatch(agent, prompt, **kwargs)
+
         coroutines = []
         for task in tasks:
-            task = dict(task)  # defensive copy
-            agent = task.pop("agent", "claude")
-            prompt = task.pop("prompt", "")
-            coroutines.append(self.dispatch(agent, prompt, **task))
+            kwargs = {k: v for k, v in task.items() if k not in ("agent", "prompt")}
+            coroutines.append(
+                _run_task(task.get("agent", "claude"), task.get("prompt", ""), **kwargs)
+            )
 
         results: list[AgentResult] = await asyncio.gather(
             *coroutines, return_exceptions=False
@@ -292,14 +448,16 @@ class AgentDispatcher:
         Args:
             cmd: The full command + args list.
             timeout: Seconds before the process is killed.
-            parser: Callable ``(stdout: str, stderr: str) -> AgentResult``.
+            parser: Callable ``(stdout: bytes, stderr: str) -> AgentResult``;
+                stdout is passed undecoded.
             agent_name: Human-readable name used in error messages.
 
         Returns:
             Parsed :class:`AgentResult`.
 
         Raises:
-            DispatchError: On timeout or non-zero exit code with empty output.
+            DispatchError: On timeout, oversized output, or non-zero exit code
+                with empty output.
         """
         try:
             proc = await asyncio.create_subprocess_exec(
@@ -309,21 +467,29 @@ class AgentDispatcher:
             )
             try:
                 stdout_bytes, stderr_bytes = await asyncio.wait_for(
-                    proc.communicate(),
+                    self._collect_output(proc),
                     timeout=float(timeout),
                 )
             except (TimeoutError, asyncio.TimeoutError):  # noqa: UP041
-                proc.kill()
-                await proc.communicate()
+                await _kill(proc)
                 raise DispatchError(
                     f"{agent_name} timed out after {timeout}s. "
                     f"Command: {' '.join(cmd[:3])}..."
                 )
+            except _OutputTooLargeError:
+                await _kill(proc)
+                raise DispatchError(
+                    f"{agent_name} output exceeded {MAX_STDOUT_BYTES} bytes; "
+                    f"process killed."
+                )
+            except asyncio.CancelledError:
+                # The caller gave up on this step; don't leave the agent running.
+                await _kill(proc)
+                raise
 
-            stdout = stdout_bytes.decode("utf-8", errors="replace")
             stderr = stderr_bytes.decode("utf-8", errors="replace")
 
-            if proc.returncode != 0 and not stdout.strip():
+            if proc.returncode != 0 and not stdout_bytes.strip():
                 raise DispatchError(
                     f"{agent_name} exited with code {proc.returncode}. "
                     f"stderr={stderr[:300]}"
@@ -333,13 +499,16 @@ class AgentDispatcher:
                 "%s returncode=%s stdout_len=%d",
                 agent_name,
                 proc.returncode,
-                len(stdout),
+                len(stdout_bytes),
             )
-            return parser(stdout, stderr)
+            return parser(stdout_bytes, stderr)
 
         except DispatchError:
             raise
         except FileNotFoundError:
+            # The cached path went stale (CLI removed or upgraded mid-process);
+            # forget it so the next dispatch looks the binary up again.
+            _resolve_binary.cache_clear()
             raise DispatchError(
                 f"{agent_name} CLI not found. "
                 f"Ensure '{cmd[0]}' is installed and on PATH."
@@ -348,3 +517,25 @@ class AgentDispatcher:
             raise DispatchError(
                 f"Unexpected error dispatching {agent_name}: {exc}"
             ) from exc
+
+    @staticmethod
+    async def _collect_output(
+        proc: asyncio.subprocess.Process,
+    ) -> tuple[bytes, bytes]:
+        """Read stdout in bounded chunks while draining stderr concurrently.
+
+        Raises:
+            _OutputTooLargeError: If stdout grows past :data:`MAX_STDOUT_BYTES`.
+        """
+        stderr_task = asyncio.ensure_future(proc.stderr.read())
+        buf = bytearray()
+        try:
+            while chunk := await proc.stdout.read(_READ_CHUNK_BYTES):
+                buf += chunk
+                if len(buf) > MAX_STDOUT_BYTES:
+                    raise _OutputTooLargeError
+            stderr_bytes = await stderr_task
+        finally:
+            stderr_task.cancel()
+        await proc.wait()
+        return bytes(buf), stderr_bytes
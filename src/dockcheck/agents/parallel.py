@@ -23,7 +23,11 @@ class ParallelTask(BaseModel):
 
 
 class ParallelResult(BaseModel):
-    """Result from a parallel dispatch batch."""
+    """Result from a parallel dispatch batch.
+
+    Built internally by :meth:`ParallelDispatcher.fan_out` from already
+    validated values, so it is created with ``model_construct`` there.
+    """
 
     task_id: str
     result: AgentStepResult | None = None
@@ -49,22 +53,37 @@ class FanOutResult(BaseModel):
 
 
 class TurnTracker:
-    """Tracks turn usage per skill for adaptive max_turns tuning."""
+    """Tracks turn usage per skill for adaptive max_turns tuning.
+
+    Sum/min/max are maintained incrementally in :meth:`record` so stats
+    queries are O(1) per skill regardless of history length.
+    """
 
     def __init__(self) -> None:
         self._history: dict[str, list[int]] = {}
+        self._sum: dict[str, int] = {}
+        self._min: dict[str, int] = {}
+        self._max: dict[str, int] = {}
 
     def record(self, skill: str, turns_used: int) -> None:
         if skill not in self._history:
             self._history[skill] = []
+            self._sum[skill] = 0
+            self._min[skill] = turns_used
+            self._max[skill] = turns_used
         self._history[skill].append(turns_used)
+        self._sum[skill] += turns_used
+        if turns_used < self._min[skill]:
+            self._min[skill] = turns_used
+        elif turns_used > self._max[skill]:
+            self._max[skill] = turns_used
 
     def suggested_max_turns(self, skill: str, default: int = 10) -> int:
         """Suggest max_turns based on historical data for this skill."""
-        history = self._history.get(skill, [])
-        if len(history) < 3:
+        count = len(self._history.get(skill, ()))
+        if count < 3:
             return default
-        avg = sum(history) / len(history)
+        avg = self._sum[skill] / count
         # Add 50% headroom above historical average
         suggested = int(avg * 1.5)
         return max(3, min(suggested, 50))  # clamp to [3, 50]
@@ -78,9 +97,9 @@ class TurnTracker:
             if history:
                 stats[skill] = {
                     "count": len(history),
-                    "avg_turns": round(sum(history) / len(history), 1),
-                    "min_turns": min(history),
-                    "max_turns": max(history),
+                    "avg_turns": round(self._sum[skill] / len(history), 1),
+                    "min_turns": self._min[skill],
+                    "max_turns": self._max[skill],
                     "suggested_max": self.suggested_max_turns(skill),
                 }
         return stats
@@ -132,6 +151,35 @@ class RunMetrics(BaseModel):
     steps: dict[str, float] = Field(default_factory=dict)  # step -> confidence
 
 
+async def _gather_fail_fast(coros: list[Any]) -> list[Any]:
+    """Like :func:`asyncio.gather`, but cancel the others on the first error.
+
+    Plain ``gather`` propagates the first exception yet leaves sibling tasks
+    running in the background; here they are cancelled and awaited before
+    the original exception is re-raised.
+    """
+    running = [asyncio.ensure_future(c) for c in coros]
+    if not running:
+        return []
+    try:
+        done, pending = await asyncio.wait(running, return_when=asyncio.FIRST_EXCEPTION)
+    except asyncio.CancelledError:
+        # Our caller was cancelled: take the children down with us.
+        for task in running:
+            task.cancel()
+        await asyncio.gather(*running, return_exceptions=True)
+        raise
+    for task in pending:
+        task.cancel()
+    if pending:
+        await asyncio.gather(*pending, return_exceptions=True)
+    for task in done:
+        exc = task.exception()
+        if exc is not None:
+            raise exc
+    return [task.result() for task in running]
+
+
 class ParallelDispatcher:
     """Manages parallel agent dispatch with fan-out/fan-in pattern."""
 
@@ -144,61 +192,81 @@ class ParallelDispatcher:
         self,
         tasks: list[ParallelTask],
         max_concurrent: int = 5,
+        fail_fast: bool = False,
     ) -> FanOutResult:
-        """Dispatch multiple tasks in parallel and collect results."""
-        start = time.time()
-        semaphore = asyncio.Semaphore(max_concurrent)
-        results: list[ParallelResult] = []
+        """Dispatch multiple tasks in parallel and collect results.
+
+        By default a failing task is recorded as a :class:`ParallelResult`
+        with ``error`` set.  With ``fail_fast=True`` the first error is raised
+        instead and every task still pending is cancelled.
+        """
+        start = time.perf_counter_ns()
 
         async def _run_task(task: ParallelTask) -> ParallelResult:
-            async with semaphore:
-                task_start = time.time()
-                try:
-                    if self._dispatcher is None:
-                        raise RuntimeError("No dispatcher configured")
-
-                    result = await self._dispatcher.dispatch(
-                        agent=task.agent,
-                        prompt=task.prompt,
-                        system_prompt=task.system_prompt,
-                        max_turns=task.max_turns,
-                        timeout=task.timeout,
-                    )
-                    elapsed = time.time() - task_start
-
-                    # Record turns for adaptive tuning
-                    self._turn_tracker.record(task.task_id, result.turns_used)
-
-                    return ParallelResult(
-                        task_id=task.task_id,
-                        result=AgentStepResult(
-                            step=task.task_id,
-                            completed=result.completed,
-                            confidence=result.confidence,
-                            turns_used=result.turns_used,
-                            summary=result.summary,
-                            findings=[
-                                Finding(severity=f.severity, message=f.message)
-                                for f in result.findings
-                            ],
-                        ),
-                        elapsed_seconds=elapsed,
-                    )
-                except Exception as e:
-                    elapsed = time.time() - task_start
-                    return ParallelResult(
-                        task_id=task.task_id,
-                        error=str(e),
-                        elapsed_seconds=elapsed,
-                    )
-
-        gathered = await asyncio.gather(
-            *[_run_task(t) for t in tasks],
-            return_exceptions=False,
-        )
-        results = list(gathered)
+            task_start = time.perf_counter_ns()
+            try:
+                if self._dispatcher is None:
+                    raise RuntimeError("No dispatcher configured")
+
+                result = await self._dispatcher.dispatch(
+                    agent=task.agent,
+                    prompt=task.prompt,
+                    system_prompt=task.system_prompt,
+                    max_turns=task.max_turns,
+                    timeout=task.timeout,
+                )
+                elapsed = (time.perf_counter_ns() - task_start) / 1e9
+
+                # Record turns for adaptive tuning
+                self._turn_tracker.record(task.task_id, result.turns_used)
+
+                return ParallelResult.model_construct(
+                    task_id=task.task_id,
+                    result=AgentStepResult(
+                        step=task.task_id,
+                        completed=result.completed,
+                        confidence=result.confidence,
+                        turns_used=result.turns_used,
+                        summary=result.summary,
+                        findings=[
+                            Finding.model_construct(
+                                severity=getattr(f.severity, "value", f.severity),
+                                message=f.message,
+                                file_path=f.file_path,
+                                line=f.line,
+                            )
+                            for f in result.findings
+                        ],
+                    ),
+                    elapsed_seconds=elapsed,
+                )
+            except Exception as e:
+                if fail_fast:
+                    raise
+                elapsed = (time.perf_counter_ns() - task_start) / 1e9
+                return ParallelResult.model_construct(
+                    task_id=task.task_id,
+                    error=str(e),
+                    elapsed_seconds=elapsed,
+                )
+
+        # A fixed pool of workers pulls from one shared iterator, so at most
+        # ``max_concurrent`` task coroutines exist at any time.
+        slots: list[ParallelResult | None] = [None] * len(tasks)
+        pending = iter(enumerate(tasks))
+
+        async def _worker() -> None:
+            for index, task in pending:
+                slots[index] = await _run_task(task)
+
+        workers = [_worker() for _ in range(min(max(max_concurrent, 1), len(tasks)))]
+        if fail_fast:
+            await _gather_fail_fast(workers)
+        else:
+            await asyncio.gather(*workers)
+        results = [r for r in slots if r is not None]
 
-        total_elapsed = time.time() - start
+        total_elapsed = (time.perf_counter_ns() - start) / 1e9
         failed = [r.task_id for r in results if r.error is not None]
         all_completed = all(
             r.result is not None and r.result.completed
@@ -206,7 +274,7 @@ class ParallelDispatcher:
             if r.error is None
         )
 
-        return FanOutResult(
+        return FanOutResult.model_construct(
             results=results,
             total_elapsed=total_elapsed,
             all_completed=all_completed and len(failed) == 0,
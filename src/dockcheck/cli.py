@@ -2,14 +2,71 @@
 
 from __future__ import annotations
 
+import functools
+import os
+import shlex
 import subprocess
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 import click
 
-from dockcheck.core.policy import EvaluationResult, Policy, PolicyEngine, Verdict
-from dockcheck.tools.hardstop import DiffAnalyzer
+if TYPE_CHECKING:
+    from dockcheck.core.policy import EvaluationResult
+    from dockcheck.init.detect import RepoContext
+    from dockcheck.init.preflight import PreflightChecker
+    from dockcheck.init.providers import ProviderRegistry
+
+
+_TEMPLATE_CHOICES = click.Choice(("hackathon", "trading-bot", "fastapi-app", "react-app"))
+_PROVIDER_CHOICES = click.Choice((
+    "cloudflare", "vercel", "fly", "netlify",
+    "docker-registry", "aws-lambda", "gcp-cloudrun",
+    "railway", "render",
+))
+
+# Characters that only /bin/sh can interpret; commands containing any of
+# them keep running through the shell.
+_SHELL_METACHARS = frozenset("|&;<>$`*?(){}[]~#!\n")
+
+# Pipeline steps that are plain subprocess commands (as opposed to CHECK
+# and DEPLOY, which run in-process).
+_COMMAND_STEPS = frozenset({"LINT", "FORMAT", "TEST"})
+
+# Per-command timeout for pipeline subprocesses, in seconds.
+_COMMAND_TIMEOUT = 300
+
+# A batched step that fails exits with this plus its index in the batch, so
+# the steps before it can be counted as passed.
+_BATCH_EXIT_BASE = 200
+
+# RepoContext flag -> provider name, in ProviderRegistry order, so the first
+# hit matches ProviderRegistry.detect(ctx)[0] without building the registry.
+_FLAG_TO_PROVIDER = (
+    ("has_wrangler_config", "cloudflare"),
+    ("has_vercel_config", "vercel"),
+    ("has_fly_config", "fly"),
+    ("has_netlify_config", "netlify"),
+    ("has_dockerfile", "docker-registry"),
+    ("has_sam_config", "aws-lambda"),
+    ("has_cloudrun_config", "gcp-cloudrun"),
+    ("has_railway_config", "railway"),
+    ("has_render_config", "render"),
+)
+
+# RepoContext flag -> label shown by `dockcheck init`, in priority order.
+_CONFIG_LABELS = (
+    ("has_wrangler_config", "Config: wrangler.toml"),
+    ("has_vercel_config", "Config: vercel.json"),
+    ("has_fly_config", "Config: fly.toml"),
+    ("has_netlify_config", "Config: netlify.toml"),
+    ("has_sam_config", "Config: template.yaml"),
+    ("has_cloudrun_config", "Config: cloudbuild.yaml"),
+    ("has_railway_config", "Config: railway.json"),
+    ("has_render_config", "Config: render.yaml"),
+)
 
 
 def _find_policy(path: str | None = None) -> Path:
@@ -21,13 +78,9 @@ def _find_policy(path: str | None = None) -> Path:
         click.echo(f"Error: policy file not found at {path}", err=True)
         sys.exit(1)
 
-    candidates = [
-        Path(".dockcheck/policy.yaml"),
-        Path("policy.yaml"),
-    ]
-    for c in candidates:
-        if c.exists():
-            return c
+    found = _policy_in(Path("."))
+    if found is not None:
+        return found
 
     click.echo(
         "Error: no policy.yaml found. Run `dockcheck init` first.",
@@ -36,6 +89,33 @@ def _find_policy(path: str | None = None) -> Path:
     sys.exit(1)
 
 
+def _detect(target_str: str) -> RepoContext:
+    """Scan the repository at *target_str*.
+
+    Commands call this once and pass the RepoContext down to their helpers,
+    rescanning only after they write files into the tree themselves.
+    """
+    from dockcheck.init.detect import RepoDetector
+
+    return RepoDetector().detect(target_str)
+
+
+@functools.cache
+def _registry() -> ProviderRegistry:
+    """Process-wide ProviderRegistry; the provider specs are static."""
+    from dockcheck.init.providers import ProviderRegistry
+
+    return ProviderRegistry()
+
+
+@functools.cache
+def _preflight() -> PreflightChecker:
+    """Process-wide PreflightChecker (it holds no per-run state)."""
+    from dockcheck.init.preflight import PreflightChecker
+
+    return PreflightChecker()
+
+
 @click.group()
 @click.version_option(package_name="dockcheck")
 def cli() -> None:
@@ -45,17 +125,13 @@ def cli() -> None:
 @cli.command()
 @click.option(
     "--template",
-    type=click.Choice(["hackathon", "trading-bot", "fastapi-app", "react-app"]),
+    type=_TEMPLATE_CHOICES,
     default=None,
     help="Template to scaffold from (skips detection).",
 )
 @click.option(
     "--provider",
-    type=click.Choice([
-        "cloudflare", "vercel", "fly", "netlify",
-        "docker-registry", "aws-lambda", "gcp-cloudrun",
-        "railway", "render",
-    ]),
+    type=_PROVIDER_CHOICES,
     default=None,
     help="Deploy provider (skips detection).",
 )
@@ -108,9 +184,7 @@ def _init_from_template(template: str, target: Path, dockcheck_dir: Path) -> Non
 
     default_policy = _default_policy(template)
     (dockcheck_dir / "policy.yaml").write_text(default_policy)
-
-    default_config = _default_config()
-    (target / "dockcheck.yml").write_text(default_config)
+    (target / "dockcheck.yml").write_text(_DEFAULT_CONFIG)
 
     click.echo(f"Initialized .dockcheck/ with template '{template}'")
     click.echo(f"  - {dockcheck_dir / 'policy.yaml'}")
@@ -131,44 +205,34 @@ def _init_smart(
     from dockcheck.github.action import WorkflowConfig, write_workflow
     from dockcheck.init.auth import AuthBootstrapper
     from dockcheck.init.detect import RepoDetector
-    from dockcheck.init.providers import ProviderRegistry
     from dockcheck.init.workspace import WorkspaceResolver
 
+    target_str = str(target)
+    env_file = os.path.join(target_str, ".env")
+
     # Check for workspace (multi-target monorepo)
     ws_resolver = WorkspaceResolver()
-    ws = ws_resolver.resolve(str(target))
+    ws = ws_resolver.resolve(target_str)
     if ws is not None and not provider_name:
         _init_workspace(target, dockcheck_dir, ws, non_interactive)
         return
 
     detector = RepoDetector()
-    registry = ProviderRegistry()
-    auth = AuthBootstrapper(env_file=str(target / ".env"))
+    registry = _registry()
+    auth = AuthBootstrapper(env_file=env_file)
 
     # 1. Scan repository
     click.echo("Scanning repository...")
-    ctx = detector.detect(str(target))
+    ctx = detector.detect(target_str)
 
     lang_display = ctx.language or "unknown"
     parts = [f"Language: {lang_display}"]
     if ctx.framework:
         parts.append(f"Framework: {ctx.framework}")
-    if ctx.has_wrangler_config:
-        parts.append("Config: wrangler.toml")
-    elif ctx.has_vercel_config:
-        parts.append("Config: vercel.json")
-    elif ctx.has_fly_config:
-        parts.append("Config: fly.toml")
-    elif ctx.has_netlify_config:
-        parts.append("Config: netlify.toml")
-    elif ctx.has_sam_config:
-        parts.append("Config: template.yaml")
-    elif ctx.has_cloudrun_config:
-        parts.append("Config: cloudbuild.yaml")
-    elif ctx.has_railway_config:
-        parts.append("Config: railway.json")
-    elif ctx.has_render_config:
-        parts.append("Config: render.yaml")
+    for attr, label in _CONFIG_LABELS:
+        if getattr(ctx, attr, False):
+            parts.append(label)
+            break
     if ctx.git_remote:
         parts.append(f"Remote: {ctx.git_remote}")
     click.echo(f"  {' | '.join(parts)}")
@@ -204,24 +268,23 @@ def _init_smart(
     if not status.all_ready:
         missing = [s for s in status.secrets if not s.available_local]
         if non_interactive:
-            click.echo("  Missing secrets (set in env or .env):")
-            for s in missing:
-                click.echo(f"    {s.name} — {s.setup_url}")
+            click.echo("\n".join(
+                ["  Missing secrets (set in env or .env):"]
+                + [f"    {s.name} — {s.setup_url}" for s in missing]
+            ))
         else:
-            for s in missing:
-                click.echo(f"  Missing: {s.name}")
+            if missing:
+                click.echo("\n".join(f"  Missing: {s.name}" for s in missing))
             collected = auth.prompt_missing(status)
             secrets_to_store = collected
     else:
         click.echo("  All secrets available.")
 
     # 4. Store secrets
-    if secrets_to_store:
-        auth.store_local(secrets_to_store, env_file=str(target / ".env"))
+    report = auth.finalize(secrets_to_store, target_str)
+    if report.stored:
         click.echo("\nStored to .env")
-
-        gitignore_updated = auth.ensure_gitignore(str(target))
-        if gitignore_updated:
+        if report.gitignore_updated:
             click.echo(".gitignore updated")
 
         if not non_interactive:
@@ -231,8 +294,6 @@ def _init_smart(
             if set_gh:
                 ok = auth.store_github(secrets_to_store)
                 click.echo("  Done" if ok else "  Partial (check warnings)")
-    else:
-        auth.ensure_gitignore(str(target))
 
     # 5. Generate policy + workflow
     dockcheck_dir.mkdir(parents=True)
@@ -254,7 +315,7 @@ def _init_smart(
         test_command=ctx.test_command,
         build_command=ctx.build_command,
     )
-    wf_path = write_workflow(str(target), wf_config)
+    wf_path = write_workflow(target_str, wf_config)
 
     click.echo(f"\nGenerated: {dockcheck_dir / 'policy.yaml'}")
     click.echo(f"Generated: {wf_path}")
@@ -387,25 +448,30 @@ def check(
     json_out: bool,
 ) -> None:
     """Evaluate commands/files/diff against policy rules."""
+    from dockcheck.core.policy import PolicyEngine, Verdict
+    from dockcheck.tools.hardstop import DiffAnalyzer
+
     policy_file = _find_policy(policy_path)
     engine = PolicyEngine.from_yaml(policy_file)
 
     all_commands = list(commands)
     all_files = list(files)
 
-    # Parse diff if provided
+    # Parse diff if provided, streaming it line by line
     if diff_source:
         if diff_source == "-":
-            diff_text = sys.stdin.read()
+            diff_paths, file_deletes = DiffAnalyzer.scan_stream(sys.stdin)
         else:
-            diff_text = Path(diff_source).read_text()
-
-        all_files.extend(DiffAnalyzer.extract_file_paths(diff_text))
-        file_deletes = DiffAnalyzer.count_file_deletes(diff_text)
+            with open(diff_source) as f:
+                diff_paths, file_deletes = DiffAnalyzer.scan_stream(f)
+        all_files.extend(diff_paths)
     else:
         file_deletes = 0
 
-    result: EvaluationResult = engine.evaluate(
+    # --files and the diff often name the same paths; match each only once.
+    all_files = list(dict.fromkeys(all_files))
+
+    result = engine.evaluate(
         commands=all_commands or None,
         file_paths=all_files or None,
         file_deletes=file_deletes,
@@ -432,6 +498,10 @@ def check(
 @click.option("--skip-lint", is_flag=True, help="Skip lint step")
 @click.option("--skip-test", is_flag=True, help="Skip test step")
 @click.option("--skip-deploy", is_flag=True, help="Skip deploy step")
+@click.option(
+    "--fast", is_flag=True,
+    help="Batch lint, format and test into one command; overlap read-only checks.",
+)
 @click.option("--agent", is_flag=True, help="Use AI agent pipeline instead of subprocess")
 def run(
     policy_path: str | None,
@@ -440,16 +510,15 @@ def run(
     skip_lint: bool,
     skip_test: bool,
     skip_deploy: bool,
+    fast: bool,
     agent: bool,
 ) -> None:
     """Execute the full CI/CD pipeline: lint -> test -> check -> deploy."""
-    from dockcheck.init.detect import RepoDetector
-
-    target = Path(target_dir).resolve()
+    target_str = os.path.abspath(target_dir)
+    target = Path(target_str)
 
     # Detect project context
-    detector = RepoDetector()
-    ctx = detector.detect(str(target))
+    ctx = _detect(target_str)
 
     deploy_provider_name = _detect_deploy_provider(target, ctx)
 
@@ -483,22 +552,22 @@ def run(
         steps.append(("DEPLOY", f"deploy:{deploy_provider_name}"))
 
     if dry_run:
-        click.echo("Pipeline plan (dry run):")
-        for i, (name, cmd) in enumerate(steps, 1):
-            click.echo(f"  {i}. {name:<8} — {cmd}")
-        click.echo(f"\nProject: {target}")
-        click.echo(f"Language: {ctx.language or 'unknown'}")
+        lines = ["Pipeline plan (dry run):"]
+        lines += [f"  {i}. {name:<8} — {cmd}" for i, (name, cmd) in enumerate(steps, 1)]
+        lines += ["", f"Project: {target}", f"Language: {ctx.language or 'unknown'}"]
         if deploy_provider_name:
-            click.echo(f"Deploy target: {deploy_provider_name}")
+            lines.append(f"Deploy target: {deploy_provider_name}")
         # Show policy info if available
         try:
             policy_file = _find_policy_quiet(policy_path, target)
             if policy_file:
-                engine = PolicyEngine.from_yaml(policy_file)
-                thresholds = engine.policy.confidence_thresholds
-                click.echo(f"Auto-deploy threshold: {thresholds.auto_deploy_staging}")
+                from dockcheck.core.policy import Policy
+
+                thresholds = Policy.from_yaml(policy_file).confidence_thresholds
+                lines.append(f"Auto-deploy threshold: {thresholds.auto_deploy_staging}")
         except Exception:
             pass
+        click.echo("\n".join(lines))
         return
 
     # Execute pipeline (run = no deploy by default)
@@ -508,17 +577,15 @@ def run(
         skip_lint=skip_lint,
         skip_test=skip_test,
         include_deploy=not skip_deploy and deploy_provider_name is not None,
+        ctx=ctx,
+        fast=fast,
     )
 
 
 @cli.command()
 @click.option(
     "--provider",
-    type=click.Choice([
-        "cloudflare", "vercel", "fly", "netlify",
-        "docker-registry", "aws-lambda", "gcp-cloudrun",
-        "railway", "render",
-    ]),
+    type=_PROVIDER_CHOICES,
     default=None,
     help="Deploy provider (auto-detected if not set).",
 )
@@ -532,14 +599,10 @@ def deploy(provider: str | None, target_dir: str) -> None:
     Assumes the project is already initialized and checks have passed.
     For the full workflow, use `dockcheck ship` instead.
     """
-    from dockcheck.init.detect import RepoDetector
-
-    target = Path(target_dir).resolve()
+    target_str = os.path.abspath(target_dir)
 
     if not provider:
-        detector = RepoDetector()
-        ctx = detector.detect(str(target))
-        provider = _detect_deploy_provider(target, ctx)
+        provider = _detect_deploy_provider(Path(target_str))
 
     if not provider:
         click.echo("Error: no deploy provider detected.", err=True)
@@ -550,7 +613,7 @@ def deploy(provider: str | None, target_dir: str) -> None:
         sys.exit(1)
 
     click.echo(f"Deploying via {provider}...")
-    ok = _run_deploy(provider, str(target))
+    ok = _run_deploy(provider, target_str)
     if not ok:
         sys.exit(1)
 
@@ -558,11 +621,7 @@ def deploy(provider: str | None, target_dir: str) -> None:
 @cli.command()
 @click.option(
     "--provider",
-    type=click.Choice([
-        "cloudflare", "vercel", "fly", "netlify",
-        "docker-registry", "aws-lambda", "gcp-cloudrun",
-        "railway", "render",
-    ]),
+    type=_PROVIDER_CHOICES,
     default=None,
     help="Deploy provider (auto-detected if not set).",
 )
@@ -577,6 +636,10 @@ def deploy(provider: str | None, target_dir: str) -> None:
     "--non-interactive", is_flag=True,
     help="Skip interactive prompts (fail if secrets missing).",
 )
+@click.option(
+    "--fast", is_flag=True,
+    help="Batch lint, format and test into one command; overlap read-only checks.",
+)
 @click.option("--agent", is_flag=True, help="Use AI agent pipeline instead of subprocess")
 def ship(
     provider: str | None,
@@ -585,6 +648,7 @@ def ship(
     skip_test: bool,
     dry_run: bool,
     non_interactive: bool,
+    fast: bool,
     agent: bool,
 ) -> None:
     """Ship it: preflight -> init -> auth -> lint -> test -> check -> deploy.
@@ -599,9 +663,9 @@ def ship(
         dockcheck ship --dry-run          # preflight only
         dockcheck ship --skip-test        # skip tests, ship fast
     """
-    from dockcheck.init.preflight import PreflightChecker
-
-    target = Path(target_dir).resolve()
+    target_str = os.path.abspath(target_dir)
+    target = Path(target_str)
+    env_file = os.path.join(target_str, ".env")
 
     # --- Check for workspace mode -------------------------------------------
     ws = _resolve_workspace_or_single(target)
@@ -613,25 +677,27 @@ def ship(
             skip_test=skip_test,
             dry_run=dry_run,
             non_interactive=non_interactive,
+            fast=fast,
             agent=agent,
         )
         return
 
     # --- Preflight -----------------------------------------------------------
     click.echo("Preflight checks...\n")
-    checker = PreflightChecker()
-    preflight = checker.check(str(target))
+    ctx = _detect(target_str)
+    preflight = _preflight().check(target_str, ctx=ctx)
 
     # Override provider if explicitly set
     if provider:
         preflight.provider_name = provider
 
     # Display checklist
+    lines: list[str] = []
     for item in preflight.items:
         icon = "ok" if item.passed else ("--" if not item.required else "FAIL")
-        click.echo(f"  [{icon:>4}] {item.name}: {item.message}")
-
-    click.echo()
+        lines.append(f"  [{icon:>4}] {item.name}: {item.message}")
+    lines.append("")
+    click.echo("\n".join(lines))
 
     # Handle blockers
     if preflight.missing_cli:
@@ -658,11 +724,9 @@ def ship(
     # --- Auth bootstrap (if needed) ------------------------------------------
     if preflight.needs_auth:
         from dockcheck.init.auth import AuthBootstrapper
-        from dockcheck.init.providers import ProviderRegistry
 
-        registry = ProviderRegistry()
-        prov_spec = registry.get(preflight.provider_name)
-        auth = AuthBootstrapper(env_file=str(target / ".env"))
+        prov_spec = _registry().get(preflight.provider_name)
+        auth = AuthBootstrapper(env_file=env_file)
 
         if non_interactive:
             click.echo("Missing secrets (set in env or .env):")
@@ -679,9 +743,8 @@ def ship(
         collected = auth.prompt_missing(status)
 
         if collected:
-            auth.store_local(collected, env_file=str(target / ".env"))
+            auth.finalize(collected, target_str)
             click.echo("Stored to .env")
-            auth.ensure_gitignore(str(target))
 
             set_gh = click.confirm("Set as GitHub Secrets?", default=True)
             if set_gh:
@@ -693,8 +756,10 @@ def ship(
     if preflight.needs_init:
         click.echo("Initializing .dockcheck/...")
         dockcheck_dir = target / ".dockcheck"
-        _auto_init(target, dockcheck_dir, preflight.provider_name)
+        _auto_init(target, dockcheck_dir, preflight.provider_name, ctx)
         click.echo()
+        # The scan above predates the files auto-init just wrote.
+        ctx = _detect(target_str)
 
     if dry_run:
         click.echo("Preflight passed. Use without --dry-run to ship.")
@@ -718,6 +783,8 @@ def ship(
             skip_lint=skip_lint,
             skip_test=skip_test,
             include_deploy=True,
+            ctx=ctx,
+            fast=fast,
         )
 
 
@@ -725,6 +792,8 @@ def ship(
 @click.option("--policy", "policy_path", type=click.Path(), default=None)
 def validate(policy_path: str | None) -> None:
     """Validate policy.yaml syntax and rules."""
+    from dockcheck.core.policy import Policy
+
     policy_file = _find_policy(policy_path)
     try:
         policy = Policy.from_yaml(policy_file)
@@ -849,17 +918,17 @@ def secrets_check(target_dir: str) -> None:
 
 
 def _auto_init(
-    target: Path, dockcheck_dir: Path, provider_name: str
+    target: Path,
+    dockcheck_dir: Path,
+    provider_name: str,
+    ctx: RepoContext | None = None,
 ) -> None:
     """Lightweight auto-init: generate policy + workflow without prompts."""
     from dockcheck.github.action import WorkflowConfig, write_workflow
-    from dockcheck.init.detect import RepoDetector
-    from dockcheck.init.providers import ProviderRegistry
 
-    detector = RepoDetector()
-    ctx = detector.detect(str(target))
-    registry = ProviderRegistry()
-    prov_spec = registry.get(provider_name)
+    if ctx is None:
+        ctx = _detect(os.path.abspath(target))
+    prov_spec = _registry().get(provider_name)
 
     dockcheck_dir.mkdir(parents=True, exist_ok=True)
     (dockcheck_dir / "skills").mkdir(exist_ok=True)
@@ -891,15 +960,21 @@ def _run_pipeline(
     skip_lint: bool = False,
     skip_test: bool = False,
     include_deploy: bool = False,
+    ctx: RepoContext | None = None,
+    fast: bool = False,
 ) -> None:
     """Execute the pipeline: lint -> format -> test -> check -> deploy.
 
+    Pass ``ctx`` when the caller has already scanned ``target``. With
+    ``fast``, lint/format/test run as a single ``&&``-chained command and
+    are only re-run one by one if that batch fails; on that re-run a
+    check-only FORMAT overlaps with LINT.
     Exits with code 1 on the first step that fails.
     """
-    from dockcheck.init.detect import RepoDetector
+    from dockcheck.core.policy import PolicyEngine, Verdict
 
-    detector = RepoDetector()
-    ctx = detector.detect(str(target))
+    if ctx is None:
+        ctx = _detect(os.path.abspath(target))
 
     # Build step list
     steps: list[tuple[str, str]] = []
@@ -917,9 +992,15 @@ def _run_pipeline(
         steps.append(("DEPLOY", f"deploy:{provider_name}"))
 
     click.echo("Running pipeline...\n")
+    batched = _run_batched(steps, target) if fast else set()
+    prechecked = _run_prechecks(steps, target) if fast and not batched else {}
     for i, (name, cmd) in enumerate(steps, 1):
         click.echo(f"  [{i}/{len(steps)}] {name}: {cmd}")
 
+        if name in batched:
+            click.echo("  -> passed")
+            continue
+
         if name == "CHECK":
             policy_file = _find_policy_quiet(None, target)
             if policy_file:
@@ -949,7 +1030,12 @@ def _run_pipeline(
             continue
 
         # Lint/format/test — run as subprocess
-        rc = _run_command(cmd, cwd=str(target))
+        if name in prechecked:
+            rc, output = prechecked[name]
+            if output:
+                click.echo(output, nl=False)
+        else:
+            rc = _run_command(cmd, cwd=str(target))
         if rc != 0:
             click.echo(f"\n  {name} failed (exit code {rc}).", err=True)
             if name == "LINT":
@@ -973,6 +1059,70 @@ def _run_pipeline(
     click.echo("\nPipeline complete!")
 
 
+def _run_batched(steps: list[tuple[str, str]], target: Path) -> set[str]:
+    """Run the command steps as one chained invocation.
+
+    Returns the names of the steps that passed. Commands that need a shell
+    of their own are not batched, since chaining them with ``&&`` could
+    change their meaning. The batch gets each step's timeout added up, and
+    each step exits with its own code on failure, so the steps that passed
+    before it are not run again.
+    """
+    batch = [(name, cmd) for name, cmd in steps if name in _COMMAND_STEPS]
+    if len(batch) < 2 or any(_command_argv(cmd) is None for _, cmd in batch):
+        return set()
+
+    click.echo(
+        f"  [batch] {' + '.join(name for name, _ in batch)}: "
+        + " && ".join(cmd for _, cmd in batch)
+    )
+    # `( ... || exit N)` means the same to /bin/sh and cmd.exe.
+    combined = " && ".join(
+        f"({cmd} || exit {_BATCH_EXIT_BASE + i})" for i, (_, cmd) in enumerate(batch)
+    )
+    rc = _run_command(
+        combined, cwd=str(target), timeout=_COMMAND_TIMEOUT * len(batch)
+    )
+    if rc == 0:
+        return {name for name, _ in batch}
+
+    failed = rc - _BATCH_EXIT_BASE
+    passed = batch[:failed] if 0 <= failed < len(batch) else []
+    if passed:
+        click.echo(
+            f"  -> batch failed at {batch[failed][0]}, re-running from there\n", err=True
+        )
+    else:
+        click.echo("  -> batch failed, re-running steps individually\n", err=True)
+    return {name for name, _ in passed}
+
+
+def _run_prechecks(
+    steps: list[tuple[str, str]], target: Path
+) -> dict[str, tuple[int, str]]:
+    """Run LINT and FORMAT concurrently, capturing their output.
+
+    Only used with ``--fast``, and only when FORMAT is a ``--check`` run:
+    a formatter that rewrites files would race the linter reading them.
+    Output is buffered per step and replayed in pipeline order so the two
+    never interleave. Returns ``{name: (exit_code, output)}``, or an empty
+    dict if there is nothing to overlap.
+    """
+    prechecks = [(name, cmd) for name, cmd in steps if name in ("LINT", "FORMAT")]
+    if len(prechecks) < 2:
+        return {}
+    format_argv = _command_argv(dict(prechecks)["FORMAT"])
+    if format_argv is None or "--check" not in format_argv:
+        return {}
+
+    with ThreadPoolExecutor(max_workers=len(prechecks)) as pool:
+        futures = {
+            name: pool.submit(_capture_command, cmd, str(target))
+            for name, cmd in prechecks
+        }
+    return {name: fut.result() for name, fut in futures.items()}
+
+
 def _resolve_workspace_or_single(target: Path) -> object | None:
     """Return a WorkspaceConfig if the target is a multi-target workspace, else None."""
     from dockcheck.init.workspace import WorkspaceResolver
@@ -988,6 +1138,7 @@ def _ship_workspace(
     skip_test: bool = False,
     dry_run: bool = False,
     non_interactive: bool = False,
+    fast: bool = False,
     agent: bool = False,
 ) -> None:
     """Ship a multi-target workspace: resolve order, deploy each target."""
@@ -1060,6 +1211,7 @@ def _ship_workspace(
                     skip_lint=skip_lint,
                     skip_test=skip_test,
                     include_deploy=provider_name is not None,
+                    fast=fast,
                 )
             deployed += 1
 
@@ -1079,11 +1231,11 @@ def _run_agent_pipeline(
     dry_run: bool = False,
 ) -> None:
     """Execute the AI agent pipeline via the Orchestrator."""
-    import asyncio
-
+    from dockcheck.agents.dispatch import run_event_loop
     from dockcheck.agents.schemas import PipelineConfig, StepConfig
     from dockcheck.core.confidence import ConfidenceScorer
     from dockcheck.core.orchestrator import Orchestrator, StdoutNotifier
+    from dockcheck.core.policy import Policy, PolicyEngine
 
     # Build agent pipeline steps
     steps: list[StepConfig] = []
@@ -1116,14 +1268,14 @@ def _run_agent_pipeline(
     pipeline = PipelineConfig(steps=steps)
 
     if dry_run:
-        click.echo("Agent pipeline plan (dry run):")
+        lines = ["Agent pipeline plan (dry run):"]
         for i, step in enumerate(steps, 1):
             dep_str = f" (after: {', '.join(step.depends_on)})" if step.depends_on else ""
-            click.echo(f"  {i}. {step.name:<10} skill={step.skill}{dep_str}")
-        click.echo(f"\nAgent: {steps[0].agent}")
-        click.echo(f"Project: {target}")
+            lines.append(f"  {i}. {step.name:<10} skill={step.skill}{dep_str}")
+        lines += ["", f"Agent: {steps[0].agent}", f"Project: {target}"]
         if provider_name:
-            click.echo(f"Deploy target: {provider_name}")
+            lines.append(f"Deploy target: {provider_name}")
+        click.echo("\n".join(lines))
         return
 
     # Build policy engine
@@ -1131,8 +1283,6 @@ def _run_agent_pipeline(
     if policy_file:
         engine = PolicyEngine.from_yaml(policy_file)
     else:
-        from dockcheck.core.policy import Policy
-
         engine = PolicyEngine(Policy.from_dict({
             "version": "1",
             "confidence_thresholds": {
@@ -1182,7 +1332,7 @@ def _run_agent_pipeline(
         skills_dir=skills_dir,
     )
 
-    result = asyncio.run(orch.run_pipeline(pipeline, context))
+    result = run_event_loop(orch.run_pipeline(pipeline, context))
 
     click.echo(f"\nConfidence: {result.confidence:.2f}")
     if result.success:
@@ -1207,54 +1357,112 @@ def _find_policy_quiet(
         p = Path(path)
         return p if p.exists() else None
 
-    bases = [target] if target else [Path(".")]
+    bases = [target, Path(".")] if target else [Path(".")]
+    seen: set[str] = set()
     for base in bases:
-        candidates = [
-            base / ".dockcheck" / "policy.yaml",
-            base / "policy.yaml",
-            Path(".dockcheck/policy.yaml"),
-            Path("policy.yaml"),
-        ]
-        for c in candidates:
-            if c.exists():
-                return c
+        key = os.path.abspath(base)
+        if key in seen:
+            continue
+        seen.add(key)
+        found = _policy_in(base)
+        if found is not None:
+            return found
     return None
 
 
+def _policy_in(base: Path) -> Path | None:
+    """Return ``base/.dockcheck/policy.yaml`` or ``base/policy.yaml`` if present."""
+    in_dir = base / ".dockcheck" / "policy.yaml"
+    if in_dir.is_file():
+        return in_dir
+    bare = base / "policy.yaml"
+    return bare if bare.is_file() else None
+
+
 def _detect_deploy_provider(target: Path, ctx: object | None = None) -> str | None:
     """Detect the deploy provider from project config."""
-    from dockcheck.init.detect import RepoDetector
-    from dockcheck.init.providers import ProviderRegistry
-
     if ctx is None:
-        detector = RepoDetector()
-        ctx = detector.detect(str(target))
+        ctx = _detect(os.path.abspath(target))
 
-    registry = ProviderRegistry()
-    detected = registry.detect(ctx)
-    if detected:
-        return detected[0].name
+    for attr, provider_name in _FLAG_TO_PROVIDER:
+        if getattr(ctx, attr, False):
+            return provider_name
     return None
 
 
-def _run_command(cmd: str, cwd: str) -> int:
-    """Run a shell command, streaming output. Returns exit code."""
+def _command_argv(cmd: str) -> list[str] | None:
+    """Split a simple command into argv, or None if it needs a shell.
+
+    Pipes, redirects, globs, variable expansion and ``VAR=value`` prefixes
+    are left to /bin/sh; everything else is exec'd directly.
+    """
+    if any(c in _SHELL_METACHARS for c in cmd):
+        return None
+    try:
+        argv = shlex.split(cmd)
+    except ValueError:
+        return None
+    if not argv or "=" in argv[0]:
+        return None
+    return argv
+
+
+def _exec_argv(cmd: str) -> list[str] | None:
+    """argv to exec *cmd* directly, or None to run it through the shell.
+
+    Windows always goes through the shell: npm, npx, yarn and friends are
+    ``.cmd`` shims there, which only ``cmd.exe`` can launch.
+    """
+    if os.name == "nt":
+        return None
+    return _command_argv(cmd)
+
+
+def _run_command(cmd: str, cwd: str, timeout: int = _COMMAND_TIMEOUT) -> int:
+    """Run a command, streaming output. Returns exit code."""
+    argv = _exec_argv(cmd)
     try:
         result = subprocess.run(
-            cmd,
-            shell=True,
+            cmd if argv is None else argv,
+            shell=argv is None,
             cwd=cwd,
-            timeout=300,
+            timeout=timeout,
         )
         return result.returncode
     except subprocess.TimeoutExpired:
-        click.echo("  Timed out after 300 seconds", err=True)
+        click.echo(f"  Timed out after {timeout} seconds", err=True)
         return 124
+    except FileNotFoundError:
+        click.echo(f"  Error: command not found: {argv[0] if argv else cmd}", err=True)
+        return 127
     except Exception as exc:
         click.echo(f"  Error: {exc}", err=True)
         return 1
 
 
+def _capture_command(cmd: str, cwd: str) -> tuple[int, str]:
+    """Like _run_command, but return combined stdout/stderr instead of streaming."""
+    argv = _exec_argv(cmd)
+    try:
+        result = subprocess.run(
+            cmd if argv is None else argv,
+            shell=argv is None,
+            cwd=cwd,
+            timeout=_COMMAND_TIMEOUT,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            text=True,
+            errors="replace",
+        )
+        return result.returncode, result.stdout or ""
+    except subprocess.TimeoutExpired:
+        return 124, f"  Timed out after {_COMMAND_TIMEOUT} seconds\n"
+    except FileNotFoundError:
+        return 127, f"  Error: command not found: {argv[0] if argv else cmd}\n"
+    except Exception as exc:
+        return 1, f"  Error: {exc}\n"
+
+
 def _run_deploy(provider_name: str, workdir: str) -> bool:
     """Run deploy via provider. Returns True on success."""
     from dockcheck.tools.deploy import DeployProviderFactory
@@ -1290,42 +1498,66 @@ def _run_deploy(provider_name: str, workdir: str) -> bool:
 def _load_env_file(workdir: str) -> dict[str, str]:
     """Read key=value pairs from .env file if it exists."""
     env_file = Path(workdir) / ".env"
-    env: dict[str, str] = {}
-    if env_file.exists():
-        try:
-            for line in env_file.read_text(encoding="utf-8").splitlines():
-                line = line.strip()
-                if not line or line.startswith("#"):
-                    continue
-                if "=" in line:
-                    key, _, value = line.partition("=")
-                    env[key.strip()] = value.strip()
-        except OSError:
-            pass
-    return env
+    try:
+        st = env_file.stat()
+    except OSError:
+        return {}
+    return dict(_parse_env_file(str(env_file), st.st_mtime_ns, st.st_size))
+
+
+@functools.lru_cache(maxsize=4)
+def _parse_env_file(
+    path: str, mtime_ns: int, size: int
+) -> tuple[tuple[str, str], ...]:
+    """Parse a .env file.
+
+    ``mtime_ns`` and ``size`` key the cache so edits are picked up, even
+    within one tick of a filesystem with coarse mtimes.
+    """
+    try:
+        data = Path(path).read_bytes()
+    except OSError:
+        return ()
+    pairs: list[tuple[str, str]] = []
+    for raw in data.splitlines():
+        line = raw.strip()
+        if not line or line[:1] == b"#" or b"=" not in line:
+            continue
+        key, _, value = line.partition(b"=")
+        pairs.append((
+            key.strip().decode("utf-8", errors="replace"),
+            value.strip().decode("utf-8", errors="replace"),
+        ))
+    return tuple(pairs)
 
 
 def _print_result(result: EvaluationResult) -> None:
-    icon = {"pass": "PASS", "fail": "FAIL", "block": "BLOCK"}[result.verdict.value]
-    click.echo(f"\n[{icon}] Policy evaluation: {result.verdict.value.upper()}")
+    verdict = result.verdict.value.upper()
+    lines = ["", f"[{verdict}] Policy evaluation: {verdict}"]
 
     if result.reasons:
-        click.echo("\nReasons:")
-        for r in result.reasons:
-            click.echo(f"  - {r}")
+        lines += ["", "Reasons:"]
+        lines += [f"  - {r}" for r in result.reasons]
 
     if result.blocked_commands:
-        click.echo(f"\nBlocked commands: {len(result.blocked_commands)}")
+        lines += ["", f"Blocked commands: {len(result.blocked_commands)}"]
     if result.blocked_paths:
-        click.echo(f"\nBlocked paths: {len(result.blocked_paths)}")
+        lines += ["", f"Blocked paths: {len(result.blocked_paths)}"]
     if result.breaker_violations:
-        click.echo(f"\nCircuit breaker violations: {len(result.breaker_violations)}")
+        lines += ["", f"Circuit breaker violations: {len(result.breaker_violations)}"]
 
-    click.echo()
+    # One write instead of one per line.
+    lines.append("")
+    click.echo("\n".join(lines))
 
 
 def _default_policy(template: str) -> str:
-    """Generate default policy YAML for a given template."""
+    """Return the default policy YAML for a given template."""
+    return _TEMPLATE_POLICIES.get(template, _TEMPLATE_POLICIES["default"])
+
+
+def _build_policy(template: str) -> str:
+    """Render the default policy YAML for a given template."""
     if template == "trading-bot":
         thresholds = {
             "auto_deploy_staging": 0.95,
@@ -1393,8 +1625,13 @@ notifications:
 """
 
 
-def _default_config() -> str:
-    return """project:
+# Rendered once at import; every template outside these keys gets "default".
+_TEMPLATE_POLICIES: dict[str, str] = {
+    t: _build_policy(t) for t in ("trading-bot", "hackathon", "default")
+}
+
+
+_DEFAULT_CONFIG = """project:
   name: "my-app"
   test_command: "pytest"
   build_command: "docker build -t my-app ."
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from enum import Enum
+from types import MappingProxyType
 
 from pydantic import BaseModel, Field
 
@@ -50,11 +51,19 @@ DEFAULT_WEIGHTS: dict[str, float] = {
 }
 
 
+# Severity -> bit, so a whole result set is classified with one OR-reduction.
+_SEVERITY_BITS: dict[str, int] = {"info": 1, "warning": 2, "error": 4, "critical": 8}
+_ERROR_BIT = _SEVERITY_BITS["error"]
+_CRITICAL_BIT = _SEVERITY_BITS["critical"]
+_FLAG_BITS = _ERROR_BIT | _CRITICAL_BIT
+
+
 class ConfidenceScorer:
     """Aggregates results from multiple agent steps into a single confidence score."""
 
     def __init__(self, weights: dict[str, float] | None = None) -> None:
-        self.weights = weights or DEFAULT_WEIGHTS
+        # Read-only copy: neither the caller nor DEFAULT_WEIGHTS can change it later.
+        self.weights = MappingProxyType(dict(weights or DEFAULT_WEIGHTS))
 
     def score(self, results: list[AgentStepResult]) -> ConfidenceScore:
         if not results:
@@ -65,8 +74,8 @@ class ConfidenceScorer:
 
         step_scores: dict[str, float] = {}
         incomplete_steps: list[str] = []
-        has_critical = False
-        has_errors = False
+        severity_mask = 0
+        bit_for = _SEVERITY_BITS.get
 
         for result in results:
             step_scores[result.step] = result.confidence
@@ -74,11 +83,14 @@ class ConfidenceScorer:
             if not result.completed:
                 incomplete_steps.append(result.step)
 
+            # Once both flags are known, later findings cannot change them.
+            if severity_mask & _FLAG_BITS == _FLAG_BITS:
+                continue
             for finding in result.findings:
-                if finding.severity == "critical":
-                    has_critical = True
-                if finding.severity == "error":
-                    has_errors = True
+                severity_mask |= bit_for(finding.severity, 0)
+
+        has_critical = bool(severity_mask & _CRITICAL_BIT)
+        has_errors = bool(severity_mask & _ERROR_BIT)
 
         # Critical findings force score to 0
         if has_critical:
@@ -94,9 +106,10 @@ class ConfidenceScorer:
         # Compute weighted average
         total_weight = 0.0
         weighted_sum = 0.0
+        weight_for = self.weights.get
 
         for step, score_val in step_scores.items():
-            weight = self.weights.get(step, 0.1)  # default weight for unknown steps
+            weight = weight_for(step, 0.1)  # default weight for unknown steps
             weighted_sum += score_val * weight
             total_weight += weight
 
@@ -114,7 +127,11 @@ class ConfidenceScorer:
         if has_errors:
             raw_score *= 0.8
 
-        final_score = round(min(1.0, max(0.0, raw_score)), 4)
+        if raw_score < 0.0:
+            raw_score = 0.0
+        elif raw_score > 1.0:
+            raw_score = 1.0
+        final_score = round(raw_score, 4)
 
         # Build reason
         reasons: list[str] = []
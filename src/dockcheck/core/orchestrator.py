@@ -16,6 +16,7 @@ from dockcheck.agents.schemas import (
     StepConfig,
 )
 from dockcheck.core.confidence import (
+    ActionNeeded,
     AgentStepResult,
     ConfidenceScorer,
 )
@@ -26,6 +27,12 @@ from dockcheck.core.policy import PolicyEngine, Verdict
 
 logger = logging.getLogger(__name__)
 
+# Closing instruction shared by every step prompt.
+_PROMPT_TAIL = (
+    "\n\nRespond with a JSON object matching the AgentResult schema: "
+    "{ completed, confidence, turns_used, summary, findings, action_needed }"
+)
+
 
 # ---------------------------------------------------------------------------
 # Notifier abstraction (thin — real implementations live in future phases)
@@ -67,35 +74,35 @@ class NullNotifier(Notifier):
 # ---------------------------------------------------------------------------
 
 
+_ACTION_MAP: dict[str | None, ActionNeeded] = {
+    "none": ActionNeeded.NONE,
+    "retry": ActionNeeded.RETRY,
+    "escalate": ActionNeeded.ESCALATE,
+    None: ActionNeeded.NONE,
+}
+
+
 def _agent_result_to_step_result(step_name: str, result: AgentResult) -> AgentStepResult:
     """Convert an :class:`AgentResult` into a :class:`AgentStepResult`.
 
     The two models are deliberately separate: ``AgentResult`` is the raw
     agent output (from dispatch) while ``AgentStepResult`` is the
-    confidence-scorer's view of a pipeline step.
+    confidence-scorer's view of a pipeline step.  ``result`` is already
+    validated, so both models are built with ``model_construct``.
     """
-    core_findings: list[CoreFinding] = []
-    for f in result.findings:
-        core_findings.append(
-            CoreFinding(
-                severity=f.severity.value,
-                message=f.message,
-                file_path=f.file_path,
-                line=f.line,
-            )
+    core_findings = [
+        CoreFinding.model_construct(
+            severity=f.severity.value,
+            message=f.message,
+            file_path=f.file_path,
+            line=f.line,
         )
+        for f in result.findings
+    ]
 
-    from dockcheck.core.confidence import ActionNeeded
+    action_needed = _ACTION_MAP.get(result.action_needed, ActionNeeded.NONE)
 
-    action_map = {
-        "none": ActionNeeded.NONE,
-        "retry": ActionNeeded.RETRY,
-        "escalate": ActionNeeded.ESCALATE,
-        None: ActionNeeded.NONE,
-    }
-    action_needed = action_map.get(result.action_needed, ActionNeeded.NONE)
-
-    return AgentStepResult(
+    return AgentStepResult.model_construct(
         step=step_name,
         completed=result.completed,
         confidence=result.confidence,
@@ -180,6 +187,9 @@ class Orchestrator:
         self._notifier = notifier or StdoutNotifier()
         self._max_retries = max_retries
         self._skills_dir = skills_dir
+        # Layer decomposition per pipeline shape: (name, depends_on) of every
+        # step, in order -> step indices per layer.
+        self._layer_cache: dict[tuple[tuple[str, tuple[str, ...]], ...], list[list[int]]] = {}
 
     # ------------------------------------------------------------------
     # Public API
@@ -207,8 +217,13 @@ class Orchestrator:
         """
         ctx = context or {}
         step_results: dict[str, AgentResult] = {}
+        # Scorer view of step_results, converted once as each step finishes.
+        scored_steps: dict[str, AgentStepResult] = {}
         block_reasons: list[str] = []
 
+        # The context is the same for every step, so check it once per run.
+        policy_block = self._policy_precheck(ctx)
+
         # Resolve execution layers (topological sort).
         layers = self._resolve_dependencies(pipeline.steps)
         logger.info(
@@ -218,11 +233,12 @@ class Orchestrator:
         )
 
         for layer_idx, layer in enumerate(layers):
-            logger.debug(
-                "Executing layer %d: %s",
-                layer_idx,
-                [s.name for s in layer],
-            )
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
+                    "Executing layer %d: %s",
+                    layer_idx,
+                    [s.name for s in layer],
+                )
 
             # Group steps within the layer by parallel_group or run as
             # individual tasks.
@@ -231,40 +247,30 @@ class Orchestrator:
             for group in groups:
                 if len(group) == 1:
                     step = group[0]
-                    result = await self._execute_step_with_retry(step, ctx)
+                    result = await self._execute_step_with_retry(step, ctx, policy_block)
                     step_results[step.name] = result
+                    scored_steps[step.name] = _agent_result_to_step_result(step.name, result)
 
                     if result.action_needed == "escalate":
                         block_reasons.append(
                             f"Step '{step.name}' escalated: {result.summary}"
                         )
                         # Escalation blocks the pipeline immediately.
-                        score = self._scorer.score(
-                            [
-                                _agent_result_to_step_result(name, r)
-                                for name, r in step_results.items()
-                            ]
-                        )
-                        self._notifier.notify(
-                            "block",
+                        return self._blocked_result(
                             f"Pipeline blocked at step '{step.name}'",
-                            {"confidence": score.score},
-                        )
-                        return PipelineResult(
-                            success=False,
-                            confidence=score.score,
-                            step_results=step_results,
-                            blocked=True,
-                            block_reasons=block_reasons,
+                            step_results,
+                            scored_steps,
+                            block_reasons,
                         )
                 else:
                     # Parallel group: run all steps concurrently.
-                    group_results = await asyncio.gather(
-                        *[self._execute_step_with_retry(s, ctx) for s in group],
-                        return_exceptions=False,
-                    )
-                    for step, result in zip(group, group_results):
+                    for step, result in await self._execute_group(
+                        group, ctx, policy_block
+                    ):
                         step_results[step.name] = result
+                        scored_steps[step.name] = _agent_result_to_step_result(
+                            step.name, result
+                        )
 
                         if result.action_needed == "escalate":
                             block_reasons.append(
@@ -273,30 +279,15 @@ class Orchestrator:
 
             # After each layer, check if any escalation occurred.
             if block_reasons:
-                score = self._scorer.score(
-                    [
-                        _agent_result_to_step_result(name, r)
-                        for name, r in step_results.items()
-                    ]
-                )
-                self._notifier.notify(
-                    "block",
+                return self._blocked_result(
                     f"Pipeline blocked after layer {layer_idx}",
-                    {"confidence": score.score},
-                )
-                return PipelineResult(
-                    success=False,
-                    confidence=score.score,
-                    step_results=step_results,
-                    blocked=True,
-                    block_reasons=block_reasons,
+                    step_results,
+                    scored_steps,
+                    block_reasons,
                 )
 
         # Aggregate confidence across all steps.
-        step_result_list = [
-            _agent_result_to_step_result(name, r) for name, r in step_results.items()
-        ]
-        confidence_score = self._scorer.score(step_result_list)
+        confidence_score = self._scorer.score(list(scored_steps.values()))
         final_confidence = confidence_score.score
 
         # Apply hard-stop: critical findings from the scorer zero out confidence.
@@ -358,6 +349,24 @@ class Orchestrator:
             block_reasons=[],
         )
 
+    def _blocked_result(
+        self,
+        message: str,
+        step_results: dict[str, AgentResult],
+        scored_steps: dict[str, AgentStepResult],
+        block_reasons: list[str],
+    ) -> PipelineResult:
+        """Score the steps run so far, notify, and build a blocked result."""
+        score = self._scorer.score(list(scored_steps.values()))
+        self._notifier.notify("block", message, {"confidence": score.score})
+        return PipelineResult(
+            success=False,
+            confidence=score.score,
+            step_results=step_results,
+            blocked=True,
+            block_reasons=block_reasons,
+        )
+
     # ------------------------------------------------------------------
     # Dependency resolution
     # ------------------------------------------------------------------
@@ -371,7 +380,8 @@ class Orchestrator:
         are all satisfied in earlier layers form subsequent layers.
 
         Each returned layer contains steps that *can* run concurrently
-        (no intra-layer dependencies).
+        (no intra-layer dependencies).  The decomposition is cached per
+        pipeline shape, so repeated runs of the same pipeline skip the sort.
 
         Args:
             steps: Flat list of step configs from the pipeline definition.
@@ -383,35 +393,59 @@ class Orchestrator:
             ValueError: If a step references an unknown dependency name or a
                 cyclic dependency is detected.
         """
-        name_to_step = {s.name: s for s in steps}
+        key = tuple((s.name, tuple(s.depends_on)) for s in steps)
+        index_layers = self._layer_cache.get(key)
+        if index_layers is None:
+            index_layers = self._layer_indices(steps)
+            self._layer_cache[key] = index_layers
+        return [[steps[i] for i in layer] for layer in index_layers]
+
+    @staticmethod
+    def _layer_indices(steps: list[StepConfig]) -> list[list[int]]:
+        """Kahn's algorithm over step indices, one frontier per layer.
+
+        Each layer keeps pipeline order.  A dependency is satisfied by the
+        first step carrying that name, as in a name-based ready scan.
+        """
+        names = {s.name for s in steps}
 
         # Validate all dependency names up-front.
         for step in steps:
             for dep in step.depends_on:
-                if dep not in name_to_step:
+                if dep not in names:
                     raise ValueError(
                         f"Step '{step.name}' depends on unknown step '{dep}'."
                     )
 
-        completed: set[str] = set()
-        remaining = list(steps)
-        layers: list[list[StepConfig]] = []
-
-        while remaining:
-            # Find all steps whose dependencies are already satisfied.
-            ready = [
-                s for s in remaining if all(d in completed for d in s.depends_on)
-            ]
-            if not ready:
-                cycle_names = [s.name for s in remaining]
-                raise ValueError(
-                    f"Cyclic dependency detected among steps: {cycle_names}"
-                )
+        in_degree: list[int] = []
+        dependents: dict[str, list[int]] = {}
+        for index, step in enumerate(steps):
+            deps = set(step.depends_on)
+            in_degree.append(len(deps))
+            for dep in deps:
+                dependents.setdefault(dep, []).append(index)
 
-            layers.append(ready)
-            for s in ready:
-                completed.add(s.name)
-                remaining.remove(s)
+        layers: list[list[int]] = []
+        completed: set[str] = set()
+        frontier = [i for i, degree in enumerate(in_degree) if degree == 0]
+        while frontier:
+            layers.append(frontier)
+            next_frontier: list[int] = []
+            for index in frontier:
+                name = steps[index].name
+                if name in completed:
+                    continue
+                completed.add(name)
+                for dependent in dependents.get(name, ()):
+                    in_degree[dependent] -= 1
+                    if in_degree[dependent] == 0:
+                        next_frontier.append(dependent)
+            next_frontier.sort()
+            frontier = next_frontier
+
+        if any(in_degree):
+            cycle_names = [s.name for s, degree in zip(steps, in_degree) if degree]
+            raise ValueError(f"Cyclic dependency detected among steps: {cycle_names}")
 
         return layers
 
@@ -419,10 +453,49 @@ class Orchestrator:
     # Step execution
     # ------------------------------------------------------------------
 
+    def _policy_precheck(self, context: dict) -> AgentResult | None:
+        """Check the context's commands and file paths against the policy.
+
+        If the policy engine returns ``Verdict.BLOCK`` (e.g. because of
+        critical-path matches in the context), every step reports the
+        returned ``action_needed="escalate"`` result instead of dispatching.
+
+        Args:
+            context: Pipeline-level context dict.
+
+        Returns:
+            The escalation :class:`AgentResult`, or ``None`` when steps may run.
+        """
+        commands = context.get("commands", [])
+        file_paths = context.get("file_paths", [])
+        if not (commands or file_paths) or not self._policy.has_hard_stops:
+            return None
+
+        eval_result = self._policy.evaluate(
+            commands=commands or None,
+            file_paths=file_paths or None,
+        )
+        if eval_result.verdict != Verdict.BLOCK:
+            return None
+        return AgentResult(
+            completed=False,
+            confidence=0.0,
+            summary=f"Blocked by policy: {'; '.join(eval_result.reasons)}",
+            action_needed="escalate",
+            findings=[
+                Finding(
+                    severity=FindingSeverity.CRITICAL,
+                    message=reason,
+                )
+                for reason in eval_result.reasons
+            ],
+        )
+
     async def _execute_step_with_retry(
         self,
         step: StepConfig,
         context: dict,
+        policy_block: AgentResult | None = None,
     ) -> AgentResult:
         """Execute a step with up to ``self._max_retries`` retry attempts.
 
@@ -431,11 +504,12 @@ class Orchestrator:
         Args:
             step: The step configuration.
             context: Pipeline-level context dict.
+            policy_block: Escalation result from the policy pre-check, if any.
 
         Returns:
             The final :class:`AgentResult` after retries.
         """
-        result = await self._execute_step(step, context)
+        result = await self._execute_step(step, context, policy_block)
         attempts = 1
 
         while result.action_needed == "retry" and attempts <= self._max_retries:
@@ -445,59 +519,82 @@ class Orchestrator:
                 attempts,
                 self._max_retries,
             )
-            result = await self._execute_step(step, context)
+            result = await self._execute_step(step, context, policy_block)
             attempts += 1
 
         return result
 
+    async def _execute_group(
+        self,
+        group: list[StepConfig],
+        context: dict,
+        policy_block: AgentResult | None = None,
+    ) -> list[tuple[StepConfig, AgentResult]]:
+        """Execute a parallel group, cancelling it on the first escalation.
+
+        An escalation blocks the pipeline whatever its siblings return, so
+        the steps still running are cancelled instead of awaited.
+
+        Args:
+            group: Steps to run concurrently.
+            context: Pipeline-level context dict.
+            policy_block: Escalation result from the policy pre-check, if any.
+
+        Returns:
+            ``(step, result)`` for every step that finished, in group order.
+        """
+        tasks = [
+            asyncio.ensure_future(
+                self._execute_step_with_retry(step, context, policy_block)
+            )
+            for step in group
+        ]
+        pending = set(tasks)
+        try:
+            while pending:
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                if any(task.result().action_needed == "escalate" for task in done):
+                    break
+        finally:
+            for task in pending:
+                task.cancel()
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
+
+        return [
+            (step, task.result())
+            for step, task in zip(group, tasks)
+            if not task.cancelled() and task.exception() is None
+        ]
+
     async def _execute_step(
         self,
         step: StepConfig,
         context: dict,
+        policy_block: AgentResult | None = None,
     ) -> AgentResult:
         """Execute a single pipeline step.
 
-        Before dispatching the agent, the policy engine is consulted.  If the
-        policy engine returns ``Verdict.BLOCK`` (e.g. because of critical-path
-        matches in the context), an :class:`AgentResult` with
-        ``action_needed="escalate"`` is returned immediately without spawning
-        a subprocess.
+        When the run's policy pre-check blocked (see :meth:`_policy_precheck`),
+        *policy_block* is returned immediately without spawning a subprocess.
 
         Args:
             step: The step to execute.
             context: Shared pipeline context (file paths, commands, etc.).
+            policy_block: Escalation result from the policy pre-check, if any.
 
         Returns:
             :class:`AgentResult` from the agent or from policy pre-check.
         """
-        # Pre-check: run policy engine against any commands/files in context.
-        commands = context.get("commands", [])
-        file_paths = context.get("file_paths", [])
-
-        if commands or file_paths:
-            eval_result = self._policy.evaluate(
-                commands=commands or None,
-                file_paths=file_paths or None,
+        if policy_block is not None:
+            logger.warning(
+                "Step '%s' blocked by policy: %s",
+                step.name,
+                [f.message for f in policy_block.findings],
             )
-            if eval_result.verdict == Verdict.BLOCK:
-                logger.warning(
-                    "Step '%s' blocked by policy: %s",
-                    step.name,
-                    eval_result.reasons,
-                )
-                return AgentResult(
-                    completed=False,
-                    confidence=0.0,
-                    summary=f"Blocked by policy: {'; '.join(eval_result.reasons)}",
-                    action_needed="escalate",
-                    findings=[
-                        Finding(
-                            severity=FindingSeverity.CRITICAL,
-                            message=reason,
-                        )
-                        for reason in eval_result.reasons
-                    ],
-                )
+            return policy_block
 
         # Build the prompt for the agent.
         prompt = self._build_prompt(step, context)
@@ -586,9 +683,7 @@ class Orchestrator:
         Returns:
             Formatted prompt string.
         """
-        lines = [
-            f"You are performing the '{step.name}' step of a CI/CD pipeline.",
-        ]
+        skill_text = f"Skill: {step.skill}"
 
         # Load skill instructions if available
         skills_dir = context.get("skills_dir") or self._skills_dir
@@ -598,26 +693,20 @@ class Orchestrator:
             try:
                 loader = SkillLoader(skills_dir=skills_dir)
                 skill = loader.load(step.skill)
-                lines.append(f"\n{skill.instructions}")
+                skill_text = f"\n{skill.instructions}"
             except FileNotFoundError:
-                lines.append(f"Skill: {step.skill}")
-        else:
-            lines.append(f"Skill: {step.skill}")
-
-        if context.get("secret_audit"):
-            lines.append(f"\nSecret Audit:\n{context['secret_audit']}")
-
-        if context.get("diff"):
-            lines.append(f"\nDiff:\n{context['diff']}")
-
-        if context.get("file_paths"):
-            lines.append(f"\nChanged files: {', '.join(context['file_paths'])}")
-
-        lines.append(
-            "\nRespond with a JSON object matching the AgentResult schema: "
-            "{ completed, confidence, turns_used, summary, findings, action_needed }"
+                pass
+
+        secret_audit = context.get("secret_audit")
+        diff = context.get("diff")
+        file_paths = context.get("file_paths")
+        return (
+            f"You are performing the '{step.name}' step of a CI/CD pipeline.\n{skill_text}"
+            + (f"\n\nSecret Audit:\n{secret_audit}" if secret_audit else "")
+            + (f"\n\nDiff:\n{diff}" if diff else "")
+            + (f"\n\nChanged files: {', '.join(file_paths)}" if file_paths else "")
+            + _PROMPT_TAIL
         )
-        return "\n".join(lines)
 
     @staticmethod
     def _group_by_parallel(
@@ -3,12 +3,17 @@
 from __future__ import annotations
 
 import fnmatch
+import os
+import re
 from enum import Enum
 from pathlib import Path
 
 import yaml
 from pydantic import BaseModel, Field
 
+# libyaml's C loader when PyYAML was built with it; same safe tag set.
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
 
 class Verdict(str, Enum):
     PASS = "pass"
@@ -64,7 +69,7 @@ class Policy(BaseModel):
     @classmethod
     def from_yaml(cls, path: str | Path) -> Policy:
         with open(path) as f:
-            data = yaml.safe_load(f)
+            data = yaml.load(f, Loader=_YAML_LOADER)
         return cls.model_validate(data)
 
     @classmethod
@@ -85,6 +90,26 @@ class PolicyEngine:
 
     def __init__(self, policy: Policy) -> None:
         self.policy = policy
+        # One alternation over every hard-stop pattern: a command that
+        # matches none of them is rejected in a single scan.
+        # evaluate() reads these plain snapshots instead of walking the model.
+        self._cmd_patterns = tuple(p.pattern for p in policy.hard_stops.commands)
+        breakers = policy.hard_stops.circuit_breakers
+        self._max_containers = breakers.max_containers
+        self._max_cost_usd = breakers.max_cost_per_run_usd
+        self._max_deploys = breakers.max_deploys_per_hour
+        self._max_file_deletes = breakers.max_file_deletes_per_turn
+        # Only command patterns and critical paths can produce a BLOCK.
+        self.has_hard_stops = bool(self._cmd_patterns or policy.hard_stops.critical_paths)
+        self._cmd_regex: re.Pattern[str] | None = (
+            re.compile("|".join(re.escape(p) for p in self._cmd_patterns))
+            if self._cmd_patterns else None
+        )
+        self._glob_regexes = self._compile_globs(policy.hard_stops.critical_paths)
+        self._path_regex: re.Pattern[str] | None = (
+            re.compile("|".join(regex.pattern for _, regex, _ in self._glob_regexes))
+            if self._glob_regexes else None
+        )
 
     @classmethod
     def from_yaml(cls, path: str | Path) -> PolicyEngine:
@@ -105,50 +130,50 @@ class PolicyEngine:
         breaker_violations: list[str] = []
 
         # Check commands against hard stop patterns
-        if commands:
+        if commands and self._cmd_regex is not None:
             for cmd in commands:
-                for pattern in self.policy.hard_stops.commands:
-                    if pattern.pattern in cmd:
+                if not self._cmd_regex.search(cmd):
+                    continue
+                for pattern in self._cmd_patterns:
+                    if pattern in cmd:
                         blocked_commands.append(cmd)
                         reasons.append(
                             f"Hard stop: command '{cmd}' matches "
-                            f"blocked pattern '{pattern.pattern}'"
+                            f"blocked pattern '{pattern}'"
                         )
 
         # Check file paths against critical paths
-        if file_paths:
+        if file_paths and self.policy.hard_stops.critical_paths:
             for fpath in file_paths:
-                for glob_pattern in self.policy.hard_stops.critical_paths:
-                    if self._matches_glob(fpath, glob_pattern):
-                        blocked_paths.append(fpath)
-                        reasons.append(
-                            f"Hard stop: path '{fpath}' matches critical pattern '{glob_pattern}'"
-                        )
+                for glob_pattern in self._matching_globs(fpath):
+                    blocked_paths.append(fpath)
+                    reasons.append(
+                        f"Hard stop: path '{fpath}' matches critical pattern '{glob_pattern}'"
+                    )
 
         # Check circuit breakers
-        breakers = self.policy.hard_stops.circuit_breakers
-        if container_count > breakers.max_containers:
+        if container_count > self._max_containers:
             breaker_violations.append(
-                f"Container count {container_count} exceeds max {breakers.max_containers}"
+                f"Container count {container_count} exceeds max {self._max_containers}"
             )
             reasons.append(breaker_violations[-1])
 
-        if cost_usd > breakers.max_cost_per_run_usd:
+        if cost_usd > self._max_cost_usd:
             breaker_violations.append(
-                f"Cost ${cost_usd:.2f} exceeds max ${breakers.max_cost_per_run_usd:.2f}"
+                f"Cost ${cost_usd:.2f} exceeds max ${self._max_cost_usd:.2f}"
             )
             reasons.append(breaker_violations[-1])
 
-        if deploys_this_hour > breakers.max_deploys_per_hour:
+        if deploys_this_hour > self._max_deploys:
             breaker_violations.append(
                 f"Deploys this hour ({deploys_this_hour}) "
-                f"exceeds max {breakers.max_deploys_per_hour}"
+                f"exceeds max {self._max_deploys}"
             )
             reasons.append(breaker_violations[-1])
 
-        if file_deletes > breakers.max_file_deletes_per_turn:
+        if file_deletes > self._max_file_deletes:
             breaker_violations.append(
-                f"File deletes ({file_deletes}) exceeds max {breakers.max_file_deletes_per_turn}"
+                f"File deletes ({file_deletes}) exceeds max {self._max_file_deletes}"
             )
             reasons.append(breaker_violations[-1])
 
@@ -168,6 +193,47 @@ class PolicyEngine:
             breaker_violations=breaker_violations,
         )
 
+    @staticmethod
+    def _compile_globs(globs: list[str]) -> list[tuple[str, re.Pattern[str], bool]]:
+        """Compile each critical-path glob once, mirroring _matches_glob.
+
+        Returns ``(glob, regex, any_depth)`` triples. For ``**/x`` the regex
+        matches ``x`` at the root or after any ``/``, and any_depth marks that
+        it must also be tried on the ``/``-normalized path. Returns an empty
+        list on platforms where fnmatch folds case or separators, so callers
+        fall back to _matches_glob there.
+        """
+        if os.path.normcase("A/") != "A/":
+            return []
+        compiled: list[tuple[str, re.Pattern[str], bool]] = []
+        for glob in globs:
+            if glob.startswith("**/"):
+                regex = re.compile(f"(?s:(?:.*/)?){fnmatch.translate(glob[3:])}")
+                compiled.append((glob, regex, True))
+            else:
+                compiled.append((glob, re.compile(fnmatch.translate(glob)), False))
+        return compiled
+
+    def _matching_globs(self, file_path: str) -> list[str]:
+        """Critical-path globs that file_path matches, in policy order."""
+        if not self._glob_regexes or self._path_regex is None:
+            return [
+                glob for glob in self.policy.hard_stops.critical_paths
+                if self._matches_glob(file_path, glob)
+            ]
+        normalized = file_path.replace("\\", "/") if "\\" in file_path else None
+        # The union of every glob regex rejects most paths in a single scan.
+        if not self._path_regex.match(file_path) and not (
+            normalized is not None and self._path_regex.match(normalized)
+        ):
+            return []
+        return [
+            glob
+            for glob, regex, any_depth in self._glob_regexes
+            if regex.match(file_path)
+            or (any_depth and normalized is not None and regex.match(normalized))
+        ]
+
     @staticmethod
     def _matches_glob(file_path: str, pattern: str) -> bool:
         """Match a file path against a glob pattern supporting ** notation."""
@@ -32,9 +32,13 @@ class WorkflowConfig(BaseModel):
     build_command: str | None = None
 
 
+# Shared default for calls without a config; the generators only read it.
+_DEFAULT_WORKFLOW_CFG = WorkflowConfig()
+
+
 def generate_workflow(config: WorkflowConfig | None = None) -> str:
     """Generate a GitHub Actions workflow YAML string."""
-    cfg = config or WorkflowConfig()
+    cfg = config or _DEFAULT_WORKFLOW_CFG
 
     trigger_block = _build_trigger_block(cfg)
     env_block = _build_env_block(cfg)
@@ -81,261 +85,226 @@ def _build_env_block(cfg: WorkflowConfig) -> str:
     return "\n".join(lines)
 
 
-def _build_steps_block(cfg: WorkflowConfig) -> str:
-    steps = []
-
-    # Checkout
-    steps.append(
-        "      - name: Checkout code\n"
-        "        uses: actions/checkout@v4\n"
-        "        with:\n"
-        "          fetch-depth: 0"
+# Fixed steps, shared by every generated workflow.
+_CHECKOUT_STEP = (
+    "      - name: Checkout code\n"
+    "        uses: actions/checkout@v4\n"
+    "        with:\n"
+    "          fetch-depth: 0"
+)
+
+_SETUP_NODE_STEP = (
+    "      - name: Set up Node.js\n"
+    "        uses: actions/setup-node@v4\n"
+    "        with:\n"
+    "          node-version: '20'"
+)
+
+_POLICY_CHECK_STEP = (
+    "      - name: Run dockcheck policy check\n"
+    "        run: |\n"
+    "          git diff origin/main...HEAD > /tmp/pr.diff\n"
+    "          dockcheck check --diff /tmp/pr.diff"
+    " --json-output > /tmp/check-result.json\n"
+    "        continue-on-error: true"
+)
+
+_PR_COMMENT_STEP = (
+    "      - name: Post results to PR\n"
+    "        if: github.event_name == 'pull_request'\n"
+    "        uses: actions/github-script@v7\n"
+    "        with:\n"
+    "          script: |\n"
+    "            const fs = require('fs');\n"
+    "            let body = '## dockcheck Results\\n\\n';\n"
+    "            try {\n"
+    "              const result = JSON.parse("
+    "fs.readFileSync("
+    "'/tmp/check-result.json', 'utf8'));\n"
+    "              body += `**Verdict:** ${result.verdict}\\n\\n`;\n"
+    "              if (result.reasons && result.reasons.length > 0) {\n"
+    "                body += '**Reasons:**\\n';\n"
+    "                result.reasons.forEach(r => body += `- ${r}\\n`);\n"
+    "              }\n"
+    "            } catch (e) {\n"
+    "              body += 'Policy check results not available.\\n';\n"
+    "            }\n"
+    "            github.rest.issues.createComment({\n"
+    "              owner: context.repo.owner,\n"
+    "              repo: context.repo.repo,\n"
+    "              issue_number: context.issue.number,\n"
+    "              body: body\n"
+    "            });"
+)
+
+# Optional command steps, in workflow order: (step name, config field).
+_COMMAND_STEPS = (
+    ("Lint", "lint_command"),
+    ("Format check", "format_command"),
+    ("Test", "test_command"),
+    ("Build", "build_command"),
+)
+
+
+def _setup_python_step(name: str, python_version: str) -> str:
+    return (
+        f"      - name: {name}\n"
+        f"        uses: actions/setup-python@v5\n"
+        f"        with:\n"
+        f"          python-version: '{python_version}'"
     )
 
+
+def _run_step(name: str, command: str) -> str:
+    return f"      - name: {name}\n        run: {command}"
+
+
+def _build_steps_block(cfg: WorkflowConfig) -> str:
+    is_node = cfg.language in ("javascript", "typescript")
+    steps = [_CHECKOUT_STEP]
+
     # Setup language runtime
-    if cfg.language in ("javascript", "typescript"):
-        steps.append(
-            "      - name: Set up Node.js\n"
-            "        uses: actions/setup-node@v4\n"
-            "        with:\n"
-            "          node-version: '20'"
-        )
+    if is_node:
+        steps.append(_SETUP_NODE_STEP)
     else:
-        steps.append(
-            f"      - name: Set up Python\n"
-            f"        uses: actions/setup-python@v5\n"
-            f"        with:\n"
-            f"          python-version: '{cfg.python_version}'"
-        )
+        steps.append(_setup_python_step("Set up Python", cfg.python_version))
 
     # Install project dependencies
-    install_cmd = cfg.install_command
-    if not install_cmd:
-        if cfg.language in ("javascript", "typescript"):
-            install_cmd = "npm ci"
-        else:
-            install_cmd = None
-
+    install_cmd = cfg.install_command or ("npm ci" if is_node else None)
     if install_cmd:
-        steps.append(
-            f"      - name: Install dependencies\n"
-            f"        run: {install_cmd}"
-        )
+        steps.append(_run_step("Install dependencies", install_cmd))
 
-    # Lint step
-    if cfg.lint_command:
-        steps.append(
-            f"      - name: Lint\n"
-            f"        run: {cfg.lint_command}"
-        )
+    # Lint, format check, test and build steps
+    for name, field in _COMMAND_STEPS:
+        command = getattr(cfg, field)
+        if command:
+            steps.append(_run_step(name, command))
 
-    # Format check step
-    if cfg.format_command:
-        steps.append(
-            f"      - name: Format check\n"
-            f"        run: {cfg.format_command}"
-        )
-
-    # Test step
-    if cfg.test_command:
-        steps.append(
-            f"      - name: Test\n"
-            f"        run: {cfg.test_command}"
-        )
-
-    # Build step
-    if cfg.build_command:
-        steps.append(
-            f"      - name: Build\n"
-            f"        run: {cfg.build_command}"
-        )
+    # Only add Python setup for JS projects that need dockcheck
+    if is_node:
+        steps.append(_setup_python_step("Set up Python (for dockcheck)", cfg.python_version))
 
     # Install dockcheck
     if cfg.dockcheck_version == "latest":
-        dockcheck_install = "pip install dockcheck"
+        steps.append(_run_step("Install dockcheck", "pip install dockcheck"))
     else:
-        dockcheck_install = f"pip install dockcheck=={cfg.dockcheck_version}"
-
-    # Only add Python setup for JS projects that need dockcheck
-    if cfg.language in ("javascript", "typescript"):
         steps.append(
-            f"      - name: Set up Python (for dockcheck)\n"
-            f"        uses: actions/setup-python@v5\n"
-            f"        with:\n"
-            f"          python-version: '{cfg.python_version}'"
+            _run_step("Install dockcheck", f"pip install dockcheck=={cfg.dockcheck_version}")
         )
 
-    steps.append(
-        f"      - name: Install dockcheck\n"
-        f"        run: {dockcheck_install}"
-    )
-
-    # Run dockcheck check
-    steps.append(
-        "      - name: Run dockcheck policy check\n"
-        "        run: |\n"
-        "          git diff origin/main...HEAD > /tmp/pr.diff\n"
-        "          dockcheck check --diff /tmp/pr.diff"
-        " --json-output > /tmp/check-result.json\n"
-        "        continue-on-error: true"
-    )
+    steps.append(_POLICY_CHECK_STEP)
 
     # Provider-specific deploy step
     deploy_step = _build_deploy_step(cfg)
     if deploy_step:
         steps.append(deploy_step)
 
-    # Post PR comment
     if cfg.post_pr_comment:
-        steps.append(
-            "      - name: Post results to PR\n"
-            "        if: github.event_name == 'pull_request'\n"
-            "        uses: actions/github-script@v7\n"
-            "        with:\n"
-            "          script: |\n"
-            "            const fs = require('fs');\n"
-            "            let body = '## dockcheck Results\\n\\n';\n"
-            "            try {\n"
-            "              const result = JSON.parse("
-            "fs.readFileSync("
-            "'/tmp/check-result.json', 'utf8'));\n"
-            "              body += `**Verdict:** ${result.verdict}\\n\\n`;\n"
-            "              if (result.reasons && result.reasons.length > 0) {\n"
-            "                body += '**Reasons:**\\n';\n"
-            "                result.reasons.forEach(r => body += `- ${r}\\n`);\n"
-            "              }\n"
-            "            } catch (e) {\n"
-            "              body += 'Policy check results not available.\\n';\n"
-            "            }\n"
-            "            github.rest.issues.createComment({\n"
-            "              owner: context.repo.owner,\n"
-            "              repo: context.repo.repo,\n"
-            "              issue_number: context.issue.number,\n"
-            "              body: body\n"
-            "            });"
-        )
+        steps.append(_PR_COMMENT_STEP)
 
     return "\n\n".join(steps)
 
 
+# Marks where cfg.deploy_secrets are rendered as ``with:`` inputs.
+_WITH_BLOCK = "{with_block}"
+
+# Provider -> deploy step YAML.  Providers missing here get no deploy step.
+_DEPLOY_STEPS: dict[str, str] = {
+    "cloudflare": (
+        "      - name: Deploy to Cloudflare Workers\n"
+        "        uses: cloudflare/wrangler-action@v3\n"
+        "        with:\n"
+        f"{_WITH_BLOCK}"
+    ),
+    "vercel": (
+        "      - name: Deploy to Vercel\n"
+        "        run: vercel deploy --prod --yes\n"
+        "        env:\n"
+        "          VERCEL_TOKEN: ${{ secrets.VERCEL_TOKEN }}"
+    ),
+    "fly": (
+        "      - name: Setup Fly.io CLI\n"
+        "        uses: superfly/flyctl-actions/setup-flyctl@master\n\n"
+        "      - name: Deploy to Fly.io\n"
+        "        run: fly deploy\n"
+        "        env:\n"
+        "          FLY_API_TOKEN: ${{ secrets.FLY_API_TOKEN }}"
+    ),
+    "netlify": (
+        "      - name: Deploy to Netlify\n"
+        "        uses: nwtgck/actions-netlify@v3\n"
+        "        with:\n"
+        "          publish-dir: './dist'\n"
+        "          production-deploy: true\n"
+        f"{_WITH_BLOCK}"
+    ),
+    "docker-registry": (
+        "      - name: Log in to Docker Hub\n"
+        "        uses: docker/login-action@v3\n"
+        "        with:\n"
+        "          username: ${{ secrets.DOCKER_USERNAME }}\n"
+        "          password: ${{ secrets.DOCKER_PASSWORD }}\n\n"
+        "      - name: Build and push Docker image\n"
+        "        uses: docker/build-push-action@v5\n"
+        "        with:\n"
+        "          push: true\n"
+        "          tags: "
+        "${{ secrets.DOCKER_USERNAME }}/"
+        "${{ github.event.repository.name }}:latest"
+    ),
+    "aws-lambda": (
+        "      - name: Configure AWS credentials\n"
+        "        uses: aws-actions/configure-aws-credentials@v4\n"
+        "        with:\n"
+        f"{_WITH_BLOCK}\n\n"
+        "      - name: Build and deploy to AWS Lambda (SAM)\n"
+        "        run: |\n"
+        "          sam build\n"
+        "          sam deploy --no-confirm-changeset"
+    ),
+    "gcp-cloudrun": (
+        "      - name: Authenticate to Google Cloud\n"
+        "        uses: google-github-actions/auth@v2\n"
+        "        with:\n"
+        f"{_WITH_BLOCK}\n\n"
+        "      - name: Deploy to Cloud Run\n"
+        "        run: |\n"
+        "          gcloud run deploy ${{ github.event.repository.name }}"
+        " --source . --region us-central1"
+        " --project ${{ secrets.GCP_PROJECT_ID }} --quiet"
+    ),
+    "railway": (
+        "      - name: Deploy to Railway\n"
+        "        run: |\n"
+        "          npm install -g @railway/cli\n"
+        "          railway up\n"
+        "        env:\n"
+        "          RAILWAY_TOKEN: ${{ secrets.RAILWAY_TOKEN }}"
+    ),
+    "render": (
+        "      - name: Deploy to Render\n"
+        "        run: curl -sS -X POST \"$RENDER_DEPLOY_HOOK_URL\"\n"
+        "        env:\n"
+        "          RENDER_DEPLOY_HOOK_URL: ${{ secrets.RENDER_DEPLOY_HOOK_URL }}"
+    ),
+}
+
+
 def _build_deploy_step(cfg: WorkflowConfig) -> str | None:
     """Build a provider-specific deploy step, or None if no provider set."""
     if not cfg.deploy_provider:
         return None
 
-    if cfg.deploy_provider == "cloudflare":
-        with_block = "\n".join(
-            f"          {k}: ${{{{ secrets.{v} }}}}"
-            for k, v in cfg.deploy_secrets.items()
-        )
-        return (
-            "      - name: Deploy to Cloudflare Workers\n"
-            "        uses: cloudflare/wrangler-action@v3\n"
-            "        with:\n"
-            f"{with_block}"
-        )
-
-    if cfg.deploy_provider == "vercel":
-        return (
-            "      - name: Deploy to Vercel\n"
-            "        run: vercel deploy --prod --yes\n"
-            "        env:\n"
-            "          VERCEL_TOKEN: ${{ secrets.VERCEL_TOKEN }}"
-        )
+    step = _DEPLOY_STEPS.get(cfg.deploy_provider)
+    if step is None or _WITH_BLOCK not in step:
+        # Unknown provider (skip deploy step) or nothing to fill in.
+        return step
 
-    if cfg.deploy_provider == "fly":
-        return (
-            "      - name: Setup Fly.io CLI\n"
-            "        uses: superfly/flyctl-actions/setup-flyctl@master\n\n"
-            "      - name: Deploy to Fly.io\n"
-            "        run: fly deploy\n"
-            "        env:\n"
-            "          FLY_API_TOKEN: ${{ secrets.FLY_API_TOKEN }}"
-        )
-
-    if cfg.deploy_provider == "netlify":
-        with_block = "\n".join(
-            f"          {k}: ${{{{ secrets.{v} }}}}"
-            for k, v in cfg.deploy_secrets.items()
-        )
-        return (
-            "      - name: Deploy to Netlify\n"
-            "        uses: nwtgck/actions-netlify@v3\n"
-            "        with:\n"
-            "          publish-dir: './dist'\n"
-            "          production-deploy: true\n"
-            f"{with_block}"
-        )
-
-    if cfg.deploy_provider == "docker-registry":
-        return (
-            "      - name: Log in to Docker Hub\n"
-            "        uses: docker/login-action@v3\n"
-            "        with:\n"
-            "          username: ${{ secrets.DOCKER_USERNAME }}\n"
-            "          password: ${{ secrets.DOCKER_PASSWORD }}\n\n"
-            "      - name: Build and push Docker image\n"
-            "        uses: docker/build-push-action@v5\n"
-            "        with:\n"
-            "          push: true\n"
-            "          tags: "
-            "${{ secrets.DOCKER_USERNAME }}/"
-            "${{ github.event.repository.name }}:latest"
-        )
-
-    if cfg.deploy_provider == "aws-lambda":
-        with_block = "\n".join(
-            f"          {k}: ${{{{ secrets.{v} }}}}"
-            for k, v in cfg.deploy_secrets.items()
-        )
-        return (
-            "      - name: Configure AWS credentials\n"
-            "        uses: aws-actions/configure-aws-credentials@v4\n"
-            "        with:\n"
-            f"{with_block}\n\n"
-            "      - name: Build and deploy to AWS Lambda (SAM)\n"
-            "        run: |\n"
-            "          sam build\n"
-            "          sam deploy --no-confirm-changeset"
-        )
-
-    if cfg.deploy_provider == "gcp-cloudrun":
-        with_block = "\n".join(
-            f"          {k}: ${{{{ secrets.{v} }}}}"
-            for k, v in cfg.deploy_secrets.items()
-        )
-        return (
-            "      - name: Authenticate to Google Cloud\n"
-            "        uses: google-github-actions/auth@v2\n"
-            "        with:\n"
-            f"{with_block}\n\n"
-            "      - name: Deploy to Cloud Run\n"
-            "        run: |\n"
-            "          gcloud run deploy ${{ github.event.repository.name }}"
-            " --source . --region us-central1"
-            " --project ${{ secrets.GCP_PROJECT_ID }} --quiet"
-        )
-
-    if cfg.deploy_provider == "railway":
-        return (
-            "      - name: Deploy to Railway\n"
-            "        run: |\n"
-            "          npm install -g @railway/cli\n"
-            "          railway up\n"
-            "        env:\n"
-            "          RAILWAY_TOKEN: ${{ secrets.RAILWAY_TOKEN }}"
-        )
-
-    if cfg.deploy_provider == "render":
-        return (
-            "      - name: Deploy to Render\n"
-            "        run: curl -sS -X POST \"$RENDER_DEPLOY_HOOK_URL\"\n"
-            "        env:\n"
-            "          RENDER_DEPLOY_HOOK_URL: ${{ secrets.RENDER_DEPLOY_HOOK_URL }}"
-        )
-
-    # Unknown provider — skip deploy step
-    return None
+    with_block = "\n".join(
+        f"          {k}: ${{{{ secrets.{v} }}}}"
+        for k, v in cfg.deploy_secrets.items()
+    )
+    return step.replace(_WITH_BLOCK, with_block)
 
 
 def write_workflow(
@@ -15,15 +15,11 @@ class HookConfig(BaseModel):
     framework: str = "script"  # "script", "pre-commit", "lefthook"
 
 
-def generate_pre_commit_script(config: HookConfig | None = None) -> str:
-    """Generate a standalone git pre-commit hook script."""
-    cfg = config or HookConfig()
+# Shared default for calls without a config; the generators only read it.
+_DEFAULT_HOOK_CFG = HookConfig()
 
-    _flags = ""
-    if cfg.check_hard_stops_only:
-        _flags = ' --commands "$(git diff --cached --name-only)"'
 
-    return """#!/bin/sh
+_PRE_COMMIT_SCRIPT = """#!/bin/sh
 # dockcheck pre-commit hook
 # Runs policy check on staged changes before allowing commit
 
@@ -57,6 +53,15 @@ exit 0
 """
 
 
+def generate_pre_commit_script(config: HookConfig | None = None) -> str:
+    """Generate a standalone git pre-commit hook script.
+
+    The script checks the full staged diff whatever *config* says, so it is
+    a fixed string.
+    """
+    return _PRE_COMMIT_SCRIPT
+
+
 def generate_pre_commit_yaml() -> str:
     """Generate .pre-commit-config.yaml entry for dockcheck."""
     return """repos:
@@ -86,7 +91,7 @@ def install_hook(
     config: HookConfig | None = None,
 ) -> Path:
     """Install a pre-commit hook to .git/hooks/."""
-    cfg = config or HookConfig()
+    cfg = config or _DEFAULT_HOOK_CFG
     git_hooks_dir = Path(target_dir) / ".git" / "hooks"
 
     if not git_hooks_dir.parent.exists():
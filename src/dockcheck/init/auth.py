@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import os
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 import click
@@ -12,6 +13,60 @@ from pydantic import BaseModel, Field
 from dockcheck.init.providers import ProviderSpec
 from dockcheck.tools.secrets import MaskedSecret
 
+# Patterns ensure_gitignore keeps in .gitignore, in the order they are written.
+_REQUIRED_GITIGNORE = (".env", ".env.*", ".dev.vars")
+
+# `gh auth status` validates the token over the network; leave room for slow links.
+_GH_PROBE_TIMEOUT = 10
+
+# Concurrent `gh secret set` calls; kept small to stay clear of API rate limits.
+_GH_MAX_WORKERS = 4
+
+
+def _env_keys(content: str) -> set[str]:
+    """Names assigned in .env-style *content*, skipping blanks and comments."""
+    keys: set[str] = set()
+    for line in content.splitlines():
+        stripped = line.strip()
+        if stripped and not stripped.startswith("#") and "=" in stripped:
+            keys.add(stripped.partition("=")[0].strip())
+    return keys
+
+
+def _find_env_keys(content: str, wanted: set[str]) -> set[str]:
+    """Which of *wanted* are assigned in .env-style *content*.
+
+    Stops scanning once every wanted name has been seen, and never collects
+    the unrelated keys.
+    """
+    found: set[str] = set()
+    for line in content.splitlines():
+        key, sep, _ = line.partition("=")
+        key = key.strip()
+        if sep and key in wanted:
+            found.add(key)
+            if len(found) == len(wanted):
+                break
+    return found
+
+
+def _set_github_secret(item: tuple[str, MaskedSecret]) -> str | None:
+    """Run one `gh secret set`; return a warning line on failure."""
+    name, masked = item
+    try:
+        result = subprocess.run(
+            ["gh", "secret", "set", name],
+            input=masked.reveal(),
+            capture_output=True,
+            text=True,
+            timeout=30,
+        )
+    except (FileNotFoundError, subprocess.TimeoutExpired):
+        return f"  Warning: gh CLI not available, skipped {name}"
+    if result.returncode != 0:
+        return f"  Warning: failed to set {name} on GitHub"
+    return None
+
 
 class SecretStatus(BaseModel):
     """Status of a single secret across local and GitHub."""
@@ -31,19 +86,30 @@ class AuthStatus(BaseModel):
     all_ready: bool = False
 
 
+class FinalizeReport(BaseModel):
+    """Outcome of persisting collected secrets locally."""
+
+    stored: bool = False
+    gitignore_updated: bool = False
+    env_path: str = ""
+
+
 class AuthBootstrapper:
     """Checks, prompts, and stores deploy secrets."""
 
     def __init__(self, env_file: str = ".env") -> None:
         self._env_file = env_file
+        self._gh_probed = False
+        self._gh_ok: bool | None = None
 
     def check(self, provider: ProviderSpec) -> AuthStatus:
         """Check which secrets are available locally and on GitHub."""
         gh_secrets = self._list_github_secrets()
+        env_keys = self._local_env_keys()
         statuses: list[SecretStatus] = []
 
         for spec in provider.required_secrets:
-            local = self._has_local(spec.name)
+            local = self._has_local(spec.name, env_keys)
             github = spec.name in gh_secrets
 
             statuses.append(
@@ -88,13 +154,10 @@ class AuthBootstrapper:
         """Append secrets to .env file (values revealed only here)."""
         target = Path(env_file or self._env_file)
 
-        # Read existing content to avoid duplicates
-        existing_keys: set[str] = set()
-        if target.exists():
-            for line in target.read_text(encoding="utf-8").splitlines():
-                stripped = line.strip()
-                if stripped and not stripped.startswith("#") and "=" in stripped:
-                    existing_keys.add(stripped.partition("=")[0].strip())
+        # Read existing content once: it gives both the keys to skip and
+        # whether the file needs a trailing newline before appending.
+        content = target.read_text(encoding="utf-8") if target.exists() else ""
+        existing_keys = _find_env_keys(content, set(secrets))
 
         lines_to_add: list[str] = []
         for name, masked in secrets.items():
@@ -102,43 +165,56 @@ class AuthBootstrapper:
                 lines_to_add.append(f"{name}={masked.reveal()}")
 
         if lines_to_add:
+            # Add newline separator if file exists and doesn't end with newline
+            sep = "\n" if content and not content.endswith("\n") else ""
             with target.open("a", encoding="utf-8") as f:
-                # Add newline separator if file exists and doesn't end with newline
-                if target.stat().st_size > 0:
-                    content = target.read_text(encoding="utf-8")
-                    if content and not content.endswith("\n"):
-                        f.write("\n")
-                for line in lines_to_add:
-                    f.write(line + "\n")
+                f.write(sep + "\n".join(lines_to_add) + "\n")
+
+    def finalize(
+        self,
+        secrets: dict[str, MaskedSecret],
+        target_dir: str = ".",
+    ) -> FinalizeReport:
+        """Store secrets to .env and make sure .gitignore covers it.
+
+        The two steps always go together after a prompt; doing them in one
+        call lets the CLI report both from a single result.
+        """
+        if secrets:
+            self.store_local(secrets)
+        return FinalizeReport(
+            stored=bool(secrets),
+            gitignore_updated=self.ensure_gitignore(target_dir),
+            env_path=self._env_file,
+        )
 
     def store_github(self, secrets: dict[str, MaskedSecret]) -> bool:
         """Store secrets as GitHub Actions secrets via `gh secret set`.
 
-        Values are piped to stdin — never passed as CLI arguments.
+        Values are piped to stdin — never passed as CLI arguments.  The
+        independent ``gh`` calls run concurrently; warnings are still
+        printed in input order.
         Returns True if all secrets were stored successfully.
         """
-        all_ok = True
-        for name, masked in secrets.items():
-            try:
-                result = subprocess.run(
-                    ["gh", "secret", "set", name],
-                    input=masked.reveal(),
-                    capture_output=True,
-                    text=True,
-                    timeout=30,
-                )
-                if result.returncode != 0:
-                    click.echo(f"  Warning: failed to set {name} on GitHub")
-                    all_ok = False
-            except (FileNotFoundError, subprocess.TimeoutExpired):
-                click.echo(f"  Warning: gh CLI not available, skipped {name}")
-                all_ok = False
-        return all_ok
+        if not secrets:
+            return True
+        gh_ok = self._probe_gh()
+        if gh_ok is False:
+            click.echo("  Warning: gh CLI not available or not logged in, skipped GitHub secrets")
+            return False
+        if gh_ok is None:
+            click.echo("  Warning: timed out checking gh login status, trying anyway")
+        workers = min(_GH_MAX_WORKERS, len(secrets))
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            warnings = list(pool.map(_set_github_secret, secrets.items()))
+        for warning in warnings:
+            if warning:
+                click.echo(warning)
+        return not any(warnings)
 
     def ensure_gitignore(self, path: str = ".") -> bool:
         """Ensure .gitignore covers .env files. Returns True if modified."""
         gitignore = Path(path) / ".gitignore"
-        required_patterns = [".env", ".env.*", ".dev.vars"]
 
         if gitignore.exists():
             content = gitignore.read_text(encoding="utf-8")
@@ -147,21 +223,15 @@ class AuthBootstrapper:
             content = ""
             lines = set()
 
-        to_add: list[str] = []
-        for pattern in required_patterns:
-            if pattern not in lines:
-                to_add.append(pattern)
-
+        to_add = [pattern for pattern in _REQUIRED_GITIGNORE if pattern not in lines]
         if not to_add:
             return False
 
+        sep = "\n" if content and not content.endswith("\n") else ""
+        if lines:  # File has content, add a comment section
+            sep += "\n# dockcheck — secrets\n"
         with gitignore.open("a", encoding="utf-8") as f:
-            if content and not content.endswith("\n"):
-                f.write("\n")
-            if lines:  # File has content, add a comment section
-                f.write("\n# dockcheck — secrets\n")
-            for pattern in to_add:
-                f.write(pattern + "\n")
+            f.write(sep + "\n".join(to_add) + "\n")
 
         return True
 
@@ -173,6 +243,7 @@ class AuthBootstrapper:
         Accepts a list of AppSecretSpec (or any object with a ``name`` attr).
         """
         gh_secrets = self._list_github_secrets()
+        env_keys = self._local_env_keys()
         statuses: list[SecretStatus] = []
 
         for spec in secrets:
@@ -180,7 +251,7 @@ class AuthBootstrapper:
             required = getattr(spec, "required", True)
             setup_url = getattr(spec, "setup_url", "")
 
-            local = self._has_local(name)
+            local = self._has_local(name, env_keys)
             github = name in gh_secrets
 
             statuses.append(
@@ -201,26 +272,25 @@ class AuthBootstrapper:
             all_ready=all_ready,
         )
 
-    def _has_local(self, name: str) -> bool:
-        """Check if secret exists in environment or .env file."""
+    def _has_local(self, name: str, env_keys: set[str] | None = None) -> bool:
+        """Check if secret exists in environment or .env file.
+
+        Pass *env_keys* from :meth:`_local_env_keys` when checking several
+        names, so the .env file is read once rather than per name.
+        """
         if os.environ.get(name):
             return True
-        env_path = Path(self._env_file)
-        if env_path.exists():
-            try:
-                for line in env_path.read_text(encoding="utf-8").splitlines():
-                    stripped = line.strip()
-                    if (
-                        stripped
-                        and not stripped.startswith("#")
-                        and "=" in stripped
-                    ):
-                        key = stripped.partition("=")[0].strip()
-                        if key == name:
-                            return True
-            except OSError:
-                pass
-        return False
+        if env_keys is None:
+            env_keys = self._local_env_keys()
+        return name in env_keys
+
+    def _local_env_keys(self) -> set[str]:
+        """Keys defined in the .env file; empty if it is missing or unreadable."""
+        try:
+            content = Path(self._env_file).read_text(encoding="utf-8")
+        except OSError:
+            return set()
+        return _env_keys(content)
 
     def _list_github_secrets(self) -> set[str]:
         """List GitHub Actions secret names via `gh secret list`."""
@@ -236,9 +306,36 @@ class AuthBootstrapper:
             names: set[str] = set()
             for line in result.stdout.splitlines():
                 # Format: NAME\tUpdated YYYY-MM-DD
-                parts = line.split("\t")
-                if parts:
-                    names.add(parts[0].strip())
+                name = line.partition("\t")[0].strip()
+                if name:
+                    names.add(name)
             return names
-        except (FileNotFoundError, subprocess.TimeoutExpired, OSError):
+        except FileNotFoundError:
+            # No gh at all; store_github need not probe for it later.
+            self._gh_probed, self._gh_ok = True, False
             return set()
+        except (subprocess.TimeoutExpired, OSError):
+            return set()
+
+    def _probe_gh(self) -> bool | None:
+        """Whether `gh` is installed and authenticated, probed once per instance.
+
+        Used by :meth:`store_github`: without it, a broken login makes each
+        of its `gh secret set` calls wait out its own network timeout.
+        Returns ``None`` when the probe timed out: the login state is
+        unknown, so callers still try the real command.
+        """
+        if not self._gh_probed:
+            self._gh_probed = True
+            try:
+                result = subprocess.run(
+                    ["gh", "auth", "status"],
+                    capture_output=True,
+                    timeout=_GH_PROBE_TIMEOUT,
+                )
+                self._gh_ok = result.returncode == 0
+            except subprocess.TimeoutExpired:
+                self._gh_ok = None
+            except (FileNotFoundError, OSError):
+                self._gh_ok = False
+        return self._gh_ok
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import fnmatch
 import re
+from collections.abc import Iterable
 
 from pydantic import BaseModel, Field
 
@@ -137,6 +138,7 @@ class DiffAnalyzer:
 
     _DIFF_FILE_RE = re.compile(r"^(?:---|\+\+\+) [ab]/(.+)$", re.MULTILINE)
     _ADDED_LINE_RE = re.compile(r"^\+(?!\+\+)(.*)$", re.MULTILINE)
+    _FILE_LINE_RE = re.compile(r"(?:---|\+\+\+) [ab]/(.+)")
 
     @staticmethod
     def extract_file_paths(diff: str) -> list[str]:
@@ -150,3 +152,22 @@ class DiffAnalyzer:
     def count_file_deletes(diff: str) -> int:
         """Count files deleted in a diff (indicated by /dev/null destination)."""
         return diff.count("+++ /dev/null")
+
+    @staticmethod
+    def scan_stream(lines: Iterable[str]) -> tuple[list[str], int]:
+        """Single pass over diff lines, returning (file paths, deleted files).
+
+        Same results as extract_file_paths + count_file_deletes, but reads
+        from an iterator (an open file, stdin) instead of a whole string.
+        """
+        paths: dict[str, None] = {}
+        deletes = 0
+        fullmatch = DiffAnalyzer._FILE_LINE_RE.fullmatch
+        for line in lines:
+            if line.startswith(("--- ", "+++ ")):
+                m = fullmatch(line.rstrip("\n"))
+                if m:
+                    paths[m.group(1)] = None
+            if "+++ /dev/null" in line:
+                deletes += line.count("+++ /dev/null")
+        return list(paths), deletes
@@ -35,6 +35,9 @@ class TestWorkflowGeneration:
         triggers = parsed.get("on") or parsed.get(True)
         assert "pull_request" in triggers
 
+    def test_no_config_matches_explicit_default(self):
+        assert generate_workflow() == generate_workflow(WorkflowConfig())
+
     def test_push_trigger(self):
         config = WorkflowConfig(trigger_on_push=True)
         output = generate_workflow(config)
@@ -190,12 +193,38 @@ class TestDeployStepGeneration:
         assert "Deploy to Cloudflare" in output
         assert "cloudflare/wrangler-action@v3" in output
 
+    def test_unknown_provider_has_no_deploy_step(self):
+        output = generate_workflow(WorkflowConfig(deploy_provider="heroku"))
+        assert "Deploy to" not in output
+
+    @pytest.mark.parametrize(
+        "provider",
+        ["cloudflare", "vercel", "fly", "netlify", "docker-registry",
+         "aws-lambda", "gcp-cloudrun", "railway", "render"],
+    )
+    def test_deploy_step_renders_secrets_and_parses(self, provider):
+        config = WorkflowConfig(
+            deploy_provider=provider,
+            deploy_secrets={"token": "MY_TOKEN"},
+        )
+        output = generate_workflow(config)
+        assert "{with_block}" not in output
+        baseline = yaml.safe_load(generate_workflow())["jobs"]["dockcheck"]["steps"]
+        steps = yaml.safe_load(output)["jobs"]["dockcheck"]["steps"]
+        assert len(steps) > len(baseline)
+
 
 class TestHookGeneration:
     def test_pre_commit_script_is_shell(self):
         script = generate_pre_commit_script()
         assert script.startswith("#!/bin/sh")
 
+    def test_pre_commit_script_is_same_for_any_config(self):
+        assert generate_pre_commit_script() == generate_pre_commit_script(HookConfig())
+        assert generate_pre_commit_script() == generate_pre_commit_script(
+            HookConfig(check_hard_stops_only=False)
+        )
+
     def test_pre_commit_script_runs_dockcheck(self):
         script = generate_pre_commit_script()
         assert "dockcheck check" in script
@@ -0,0 +1,70 @@
+"""Tests for agent adapters — availability checks and factory."""
+
+from __future__ import annotations
+
+from unittest.mock import patch
+
+import pytest
+
+from dockcheck.agents.adapters import (
+    ClaudeAdapter,
+    CodexAdapter,
+    clear_availability_cache,
+    get_adapter,
+)
+from dockcheck.agents.dispatch import AgentDispatcher
+
+
+@pytest.fixture(autouse=True)
+def _fresh_cache():
+    clear_availability_cache()
+    yield
+    clear_availability_cache()
+
+
+class TestIsAvailable:
+    def test_claude_available_when_on_path(self):
+        with patch("shutil.which", return_value="/usr/bin/claude"):
+            assert ClaudeAdapter().is_available() is True
+
+    def test_codex_unavailable_when_missing(self):
+        with patch("shutil.which", return_value=None):
+            assert CodexAdapter().is_available() is False
+
+    def test_lookup_is_memoized(self):
+        with patch("shutil.which", return_value="/usr/bin/claude") as mock_which:
+            adapter = ClaudeAdapter()
+            adapter.is_available()
+            adapter.is_available()
+            repr(adapter)
+        mock_which.assert_called_once_with("claude")
+
+    def test_clear_cache_forces_new_lookup(self):
+        with patch("shutil.which", return_value=None) as mock_which:
+            ClaudeAdapter().is_available()
+            clear_availability_cache()
+            ClaudeAdapter().is_available()
+        assert mock_which.call_count == 2
+
+
+class TestGetAdapter:
+    def test_returns_claude(self):
+        assert isinstance(get_adapter("claude"), ClaudeAdapter)
+
+    def test_returns_codex(self):
+        assert isinstance(get_adapter("codex"), CodexAdapter)
+
+    def test_unknown_agent_raises(self):
+        with pytest.raises(ValueError, match="Unknown agent"):
+            get_adapter("gpt5")
+
+
+class TestDefaultDispatcher:
+    def test_adapters_share_default_dispatcher(self):
+        claude = ClaudeAdapter()
+        codex = CodexAdapter()
+        assert claude._dispatcher is codex._dispatcher
+
+    def test_explicit_dispatcher_is_used(self):
+        dispatcher = AgentDispatcher()
+        assert ClaudeAdapter(dispatcher=dispatcher)._dispatcher is dispatcher
@@ -58,6 +58,25 @@ class TestAuthCheck:
 
         assert status.all_ready is True
 
+    def test_env_file_read_once_per_check(self, tmp_path: Path, monkeypatch):
+        monkeypatch.delenv("CLOUDFLARE_API_TOKEN", raising=False)
+        monkeypatch.delenv("CLOUDFLARE_ACCOUNT_ID", raising=False)
+
+        env_file = tmp_path / ".env"
+        env_file.write_text("# comment\nCLOUDFLARE_API_TOKEN = x\n\nOTHER=1\n")
+
+        auth = AuthBootstrapper(env_file=str(env_file))
+        cf = ProviderRegistry().get("cloudflare")
+
+        with patch.object(auth, "_list_github_secrets", return_value=set()), \
+                patch.object(Path, "read_text", autospec=True,
+                             side_effect=Path.read_text) as read_text:
+            status = auth.check(cf)
+
+        assert read_text.call_count == 1
+        local = {s.name: s.available_local for s in status.secrets}
+        assert local == {"CLOUDFLARE_API_TOKEN": True, "CLOUDFLARE_ACCOUNT_ID": False}
+
     def test_github_secret_detected(self, tmp_path: Path, monkeypatch):
         monkeypatch.setenv("CLOUDFLARE_API_TOKEN", "tok")
         monkeypatch.setenv("CLOUDFLARE_ACCOUNT_ID", "acc")
@@ -101,6 +120,16 @@ class TestGitignoreEnforcement:
         assert ".env" in content
         assert "dockcheck" in content  # comment section
 
+    def test_appended_section_layout(self, tmp_path: Path):
+        gitignore = tmp_path / ".gitignore"
+        gitignore.write_text("node_modules/\n.env")
+
+        auth = AuthBootstrapper(env_file=str(tmp_path / ".env"))
+        assert auth.ensure_gitignore(str(tmp_path)) is True
+        assert gitignore.read_text() == (
+            "node_modules/\n.env\n\n# dockcheck — secrets\n.env.*\n.dev.vars\n"
+        )
+
     def test_no_change_if_already_covered(self, tmp_path: Path):
         gitignore = tmp_path / ".gitignore"
         gitignore.write_text(".env\n.env.*\n.dev.vars\n")
@@ -150,6 +179,55 @@ class TestStoreLocal:
         assert content.count("API_KEY=") == 1
         assert "API_KEY=old_value" in content
 
+    def test_only_missing_keys_are_added(self, tmp_path: Path):
+        env_file = tmp_path / ".env"
+        env_file.write_text("# API_KEY=commented\nOTHER=1\n  TOKEN = set\nNOEQUALS\n")
+
+        auth = AuthBootstrapper(env_file=str(env_file))
+        auth.store_local({
+            "API_KEY": MaskedSecret("a"),
+            "TOKEN": MaskedSecret("t"),
+            "NOEQUALS": MaskedSecret("n"),
+        })
+
+        assert env_file.read_text().endswith("NOEQUALS\nAPI_KEY=a\nNOEQUALS=n\n")
+
+    def test_separates_file_without_trailing_newline(self, tmp_path: Path):
+        env_file = tmp_path / ".env"
+        env_file.write_text("EXISTING=value")
+
+        auth = AuthBootstrapper(env_file=str(env_file))
+        with patch.object(Path, "read_text", autospec=True,
+                          side_effect=Path.read_text) as read_text:
+            auth.store_local({"NEW_KEY": MaskedSecret("new_value")})
+
+        assert read_text.call_count == 1
+        assert env_file.read_text() == "EXISTING=value\nNEW_KEY=new_value\n"
+
+
+class TestFinalize:
+    def test_stores_and_updates_gitignore(self, tmp_path: Path):
+        env_file = tmp_path / ".env"
+        auth = AuthBootstrapper(env_file=str(env_file))
+
+        report = auth.finalize({"API_KEY": MaskedSecret("s3cret")}, str(tmp_path))
+
+        assert report.stored is True
+        assert report.gitignore_updated is True
+        assert report.env_path == str(env_file)
+        assert "API_KEY=s3cret" in env_file.read_text()
+        assert ".env" in (tmp_path / ".gitignore").read_text()
+
+    def test_nothing_to_store_still_checks_gitignore(self, tmp_path: Path):
+        (tmp_path / ".gitignore").write_text(".env\n.env.*\n.dev.vars\n")
+        auth = AuthBootstrapper(env_file=str(tmp_path / ".env"))
+
+        report = auth.finalize({}, str(tmp_path))
+
+        assert report.stored is False
+        assert report.gitignore_updated is False
+        assert not (tmp_path / ".env").exists()
+
 
 class TestStoreGitHub:
     def test_store_github_success(self, tmp_path: Path):
@@ -189,6 +267,76 @@ class TestStoreGitHub:
 
         assert ok is False
 
+    def test_store_github_many_secrets_reports_in_order(self, tmp_path: Path, capsys):
+        auth = AuthBootstrapper(env_file=str(tmp_path / ".env"))
+        names = ["A", "B", "C", "D", "E"]
+        secrets = {name: MaskedSecret(f"v-{name}") for name in names}
+
+        def fake_run(cmd, **kwargs):
+            code = 1 if cmd[-1] in ("B", "D") else 0
+            return subprocess.CompletedProcess(args=cmd, returncode=code)
+
+        with patch("subprocess.run", side_effect=fake_run) as mock_run:
+            ok = auth.store_github(secrets)
+
+        assert ok is False
+        set_calls = [c.args[0] for c in mock_run.call_args_list if c.args[0][1] == "secret"]
+        assert sorted(cmd[-1] for cmd in set_calls) == names
+        out = capsys.readouterr().out.splitlines()
+        assert out == [
+            "  Warning: failed to set B on GitHub",
+            "  Warning: failed to set D on GitHub",
+        ]
+
+    def test_store_github_skips_when_gh_not_logged_in(self, tmp_path: Path, capsys):
+        auth = AuthBootstrapper(env_file=str(tmp_path / ".env"))
+        secrets = {"A": MaskedSecret("a"), "B": MaskedSecret("b")}
+
+        mock_result = subprocess.CompletedProcess(args=[], returncode=1)
+        with patch("subprocess.run", return_value=mock_result) as mock_run:
+            ok = auth.store_github(secrets)
+
+        assert ok is False
+        mock_run.assert_called_once()
+        assert mock_run.call_args.args[0] == ["gh", "auth", "status"]
+        assert "skipped GitHub secrets" in capsys.readouterr().out
+
+    def test_gh_probe_runs_once_per_instance(self, tmp_path: Path):
+        auth = AuthBootstrapper(env_file=str(tmp_path / ".env"))
+
+        mock_result = subprocess.CompletedProcess(args=[], returncode=1)
+        with patch("subprocess.run", return_value=mock_result) as mock_run:
+            assert auth.store_github({"A": MaskedSecret("a")}) is False
+            assert auth.store_github({"B": MaskedSecret("b")}) is False
+
+        mock_run.assert_called_once()
+
+    def test_missing_gh_in_list_skips_later_probe(self, tmp_path: Path):
+        auth = AuthBootstrapper(env_file=str(tmp_path / ".env"))
+
+        with patch("subprocess.run", side_effect=FileNotFoundError) as mock_run:
+            assert auth._list_github_secrets() == set()
+            assert auth.store_github({"A": MaskedSecret("a")}) is False
+
+        mock_run.assert_called_once()
+
+    def test_gh_probe_timeout_still_tries(self, tmp_path: Path, capsys):
+        auth = AuthBootstrapper(env_file=str(tmp_path / ".env"))
+
+        def fake_run(cmd, **kwargs):
+            if cmd[1] == "auth":
+                raise subprocess.TimeoutExpired(cmd, kwargs["timeout"])
+            return subprocess.CompletedProcess(args=cmd, returncode=0)
+
+        with patch("subprocess.run", side_effect=fake_run) as mock_run:
+            assert auth.store_github({"A": MaskedSecret("a")}) is True
+
+        assert mock_run.call_args_list[0].kwargs["timeout"] >= 10
+        assert mock_run.call_args.args[0] == ["gh", "secret", "set", "A"]
+        out = capsys.readouterr().out
+        assert "timed out checking gh login" in out
+        assert "not logged in" not in out
+
 
 class TestListGitHubSecrets:
     def test_list_parses_output(self, tmp_path: Path):
@@ -202,11 +350,23 @@ class TestListGitHubSecrets:
             ),
             stderr="",
         )
-        with patch("subprocess.run", return_value=mock_result):
+        with patch("subprocess.run", return_value=mock_result) as mock_run:
             secrets = auth._list_github_secrets()
 
         assert "CLOUDFLARE_API_TOKEN" in secrets
         assert "CLOUDFLARE_ACCOUNT_ID" in secrets
+        # No `gh auth status` probe on the common path.
+        mock_run.assert_called_once()
+
+    def test_list_skips_blank_lines(self, tmp_path: Path):
+        auth = AuthBootstrapper(env_file=str(tmp_path / ".env"))
+        mock_result = subprocess.CompletedProcess(
+            args=[], returncode=0, stdout="\nAPI_KEY\tUpdated 2026-01-01\n\n", stderr=""
+        )
+        with patch("subprocess.run", return_value=mock_result):
+            secrets = auth._list_github_secrets()
+
+        assert secrets == {"API_KEY"}
 
     def test_list_empty_on_failure(self, tmp_path: Path):
         auth = AuthBootstrapper(env_file=str(tmp_path / ".env"))
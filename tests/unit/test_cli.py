@@ -0,0 +1,133 @@
+"""Tests for the check and validate CLI commands."""
+
+from __future__ import annotations
+
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+import yaml
+from click.testing import CliRunner
+
+from dockcheck.cli import _default_policy, cli
+
+FIXTURES = Path(__file__).parent.parent / "fixtures"
+SAMPLE_POLICY = str(FIXTURES / "sample_policy.yaml")
+
+
+@pytest.fixture()
+def runner():
+    return CliRunner()
+
+
+class TestCheckCommand:
+    def test_clean_input_passes(self, runner):
+        result = runner.invoke(
+            cli, ["check", "--policy", SAMPLE_POLICY, "--commands", "ls -la"]
+        )
+        assert result.exit_code == 0
+        assert "[PASS] Policy evaluation: PASS" in result.output
+
+    def test_hard_stop_blocks(self, runner):
+        result = runner.invoke(
+            cli, ["check", "--policy", SAMPLE_POLICY, "--commands", "rm -rf /"]
+        )
+        assert result.exit_code == 2
+        lines = result.output.splitlines()
+        assert lines[0] == ""
+        assert lines[1] == "[BLOCK] Policy evaluation: BLOCK"
+        assert lines[2:4] == ["", "Reasons:"]
+        assert lines[4].startswith("  - ")
+        assert "Blocked commands: 1" in lines
+        assert result.output.endswith("\n\n")
+
+    def test_json_output(self, runner):
+        result = runner.invoke(
+            cli,
+            ["check", "--policy", SAMPLE_POLICY, "--files", "app/production/db.py",
+             "--json-output"],
+        )
+        assert result.exit_code == 2
+        assert '"verdict": "block"' in result.output
+
+
+class TestValidateCommand:
+    def test_valid_policy(self, runner):
+        result = runner.invoke(cli, ["validate", "--policy", SAMPLE_POLICY])
+        assert result.exit_code == 0
+        assert "Policy valid" in result.output
+        assert "Hard stop commands: 8" in result.output
+
+    def test_missing_policy(self, runner, tmp_path):
+        result = runner.invoke(
+            cli, ["validate", "--policy", str(tmp_path / "nope.yaml")]
+        )
+        assert result.exit_code == 1
+
+
+class TestDefaultPolicy:
+    @pytest.mark.parametrize(
+        "template", ["hackathon", "trading-bot", "fastapi-app", "react-app"]
+    )
+    def test_templates_are_valid_policies(self, template):
+        from dockcheck.core.policy import Policy
+
+        policy = Policy.from_dict(yaml.safe_load(_default_policy(template)))
+        assert policy.version == "1"
+
+    def test_unknown_template_uses_default_thresholds(self):
+        assert _default_policy("fastapi-app") == _default_policy("react-app")
+        assert "auto_deploy_staging: 0.8" in _default_policy("react-app")
+
+    def test_trading_bot_adds_commands(self):
+        assert 'pattern: "place_order"' in _default_policy("trading-bot")
+        assert "place_order" not in _default_policy("hackathon")
+
+
+class TestCheckDiff:
+    def test_diff_from_file(self, runner):
+        diff = str(FIXTURES / "sample_diffs" / "dangerous_change.diff")
+        result = runner.invoke(
+            cli, ["check", "--policy", SAMPLE_POLICY, "--diff", diff, "--json-output"]
+        )
+        assert result.exit_code == 2
+        assert ".env.production" in result.output
+
+    def test_diff_from_stdin(self, runner):
+        diff = (FIXTURES / "sample_diffs" / "safe_change.diff").read_text()
+        result = runner.invoke(
+            cli, ["check", "--policy", SAMPLE_POLICY, "--diff", "-"], input=diff
+        )
+        assert result.exit_code == 0
+
+
+class TestLazyImports:
+    def test_check_does_not_load_init_subsystem(self):
+        # Run in a fresh interpreter so other tests' imports don't leak in.
+        code = (
+            "import sys\n"
+            "from click.testing import CliRunner\n"
+            "from dockcheck.cli import cli\n"
+            f"r = CliRunner().invoke(cli, ['check', '--policy', {SAMPLE_POLICY!r}])\n"
+            "assert r.exit_code == 0, r.output\n"
+            "print(sorted(m for m in sys.modules if m.startswith("
+            "('dockcheck.init', 'dockcheck.github', 'dockcheck.agents', "
+            "'dockcheck.core.confidence'))))\n"
+        )
+        out = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        )
+        assert out.stdout.strip() == "[]"
+
+    def test_files_and_diff_paths_are_deduplicated(self, runner):
+        diff = str(FIXTURES / "sample_diffs" / "dangerous_change.diff")
+        result = runner.invoke(
+            cli,
+            ["check", "--policy", SAMPLE_POLICY, "--diff", diff,
+             "--files", ".env.production", "--files", ".env.production",
+             "--json-output"],
+        )
+        payload = json.loads(result.output)
+        assert payload["blocked_paths"].count(".env.production") == 1
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import json
+import os
 import subprocess
 from pathlib import Path
 from unittest.mock import MagicMock, patch
@@ -10,7 +11,19 @@ from unittest.mock import MagicMock, patch
 import pytest
 from click.testing import CliRunner
 
-from dockcheck.cli import _load_env_file, _run_deploy, cli
+from dockcheck.cli import (
+    _FLAG_TO_PROVIDER,
+    _capture_command,
+    _command_argv,
+    _detect_deploy_provider,
+    _find_policy_quiet,
+    _load_env_file,
+    _preflight,
+    _registry,
+    _run_command,
+    _run_deploy,
+    cli,
+)
 
 # Mock subprocess that returns empty/failure for all calls (git, gh, etc.)
 _MOCK_SUBPROCESS_EMPTY = subprocess.CompletedProcess(
@@ -507,6 +520,146 @@ class TestRunPipeline:
             ]
             assert len(lines) == 1  # only one step
 
+    def test_fast_batches_command_steps(self, runner):
+        with runner.isolated_filesystem():
+            pkg = {"scripts": {"lint": "eslint .", "test": "jest"}}
+            Path("package.json").write_text(json.dumps(pkg))
+
+            with patch("dockcheck.cli._run_command", return_value=0) as mock_run:
+                result = runner.invoke(cli, ["run", "--fast", "--skip-deploy"])
+
+            assert result.exit_code == 0, result.output
+            mock_run.assert_called_once()
+            assert mock_run.call_args[0][0] == (
+                "(npm run lint || exit 200) && (npm test || exit 201)"
+            )
+            assert "npm run lint && npm test" in result.output
+            assert "Pipeline complete" in result.output
+
+    def test_fast_reruns_steps_to_find_failure(self, runner):
+        with runner.isolated_filesystem():
+            pkg = {"scripts": {"lint": "eslint .", "test": "jest"}}
+            Path("package.json").write_text(json.dumps(pkg))
+
+            # batch fails, lint passes on its own, test fails
+            with patch(
+                "dockcheck.cli._run_command", side_effect=[1, 0, 1]
+            ) as mock_run:
+                result = runner.invoke(cli, ["run", "--fast", "--skip-deploy"])
+
+            assert result.exit_code == 1
+            assert [c[0][0] for c in mock_run.call_args_list][1:] == [
+                "npm run lint", "npm test",
+            ]
+            assert "TEST failed" in result.output
+
+    def test_fast_keeps_steps_that_passed_in_batch(self, runner):
+        with runner.isolated_filesystem():
+            pkg = {"scripts": {"lint": "eslint .", "test": "jest"}}
+            Path("package.json").write_text(json.dumps(pkg))
+
+            # batch reports TEST (index 1) as the failing step
+            with patch(
+                "dockcheck.cli._run_command", side_effect=[201, 1]
+            ) as mock_run:
+                result = runner.invoke(cli, ["run", "--fast", "--skip-deploy"])
+
+            assert result.exit_code == 1
+            assert [c[0][0] for c in mock_run.call_args_list][1:] == ["npm test"]
+            assert "batch failed at TEST" in result.output
+            assert "TEST failed" in result.output
+
+    def test_fast_batch_timeout_covers_every_step(self, runner):
+        with runner.isolated_filesystem():
+            pkg = {"scripts": {"lint": "eslint .", "test": "jest"}}
+            Path("package.json").write_text(json.dumps(pkg))
+            completed = subprocess.CompletedProcess(args=[], returncode=0, stdout="")
+
+            with patch("subprocess.run", return_value=completed) as mock_run:
+                result = runner.invoke(cli, ["run", "--fast", "--skip-deploy"])
+
+            assert result.exit_code == 0, result.output
+            batch_call = next(
+                c for c in mock_run.call_args_list if "exit 200" in str(c.args[0])
+            )
+            assert batch_call.kwargs["timeout"] == 2 * 300
+
+    def test_fast_skips_batch_for_shell_commands(self, runner):
+        with runner.isolated_filesystem():
+            pkg = {"scripts": {"test": "jest"}}
+            Path("package.json").write_text(json.dumps(pkg))
+
+            with (
+                patch("dockcheck.cli._run_command", return_value=0) as mock_run,
+                patch("dockcheck.cli._detect") as mock_detect,
+            ):
+                mock_detect.return_value.lint_command = "eslint . | tee lint.log"
+                mock_detect.return_value.format_command = None
+                mock_detect.return_value.test_command = "jest"
+                result = runner.invoke(cli, ["run", "--fast", "--skip-deploy"])
+
+            assert result.exit_code == 0, result.output
+            assert mock_run.call_count == 2
+
+    def test_lint_and_format_run_in_order_by_default(self, runner):
+        with runner.isolated_filesystem():
+            Path("pyproject.toml").write_text(
+                '[project]\nname = "app"\n\n[tool.ruff]\nline-length = 100'
+            )
+
+            with (
+                patch("dockcheck.cli._capture_command") as mock_capture,
+                patch("dockcheck.cli._run_command", return_value=1) as mock_run,
+            ):
+                result = runner.invoke(cli, ["run", "--skip-deploy"])
+
+            assert result.exit_code == 1
+            mock_capture.assert_not_called()
+            # LINT failed, so FORMAT never starts.
+            assert [c[0][0] for c in mock_run.call_args_list] == ["ruff check ."]
+            assert "LINT failed (exit code 1)" in result.output
+
+    def test_fast_overlaps_check_only_format(self, runner):
+        with runner.isolated_filesystem():
+            Path("pyproject.toml").write_text(
+                '[project]\nname = "app"\n\n[tool.ruff]\nline-length = 100'
+            )
+            outputs = {
+                "ruff check .": (0, "lint ok\n"),
+                "ruff format --check .": (1, "would reformat app.py\n"),
+            }
+
+            with (
+                patch(
+                    "dockcheck.cli._capture_command",
+                    side_effect=lambda cmd, cwd: outputs[cmd],
+                ) as mock_capture,
+                patch("dockcheck.cli._run_command", return_value=1) as mock_run,
+            ):
+                result = runner.invoke(cli, ["run", "--fast", "--skip-deploy"])
+
+            assert result.exit_code == 1
+            assert mock_capture.call_count == 2
+            mock_run.assert_called_once()  # only the failed batch
+            assert result.output.index("lint ok") < result.output.index("would reformat")
+            assert "FORMAT failed (exit code 1)" in result.output
+
+    def test_fast_does_not_overlap_rewriting_format(self, runner):
+        with runner.isolated_filesystem():
+            pkg = {"scripts": {"lint": "eslint .", "format": "prettier --write ."}}
+            Path("package.json").write_text(json.dumps(pkg))
+
+            with (
+                patch("dockcheck.cli._capture_command") as mock_capture,
+                patch("dockcheck.cli._run_command", side_effect=[1, 0, 0]) as mock_run,
+            ):
+                result = runner.invoke(cli, ["run", "--fast", "--skip-deploy"])
+
+            assert result.exit_code == 0, result.output
+            mock_capture.assert_not_called()
+            assert [c[0][0] for c in mock_run.call_args_list][1:] == [
+                "npm run lint", "npm run format",
+            ]
 
 # ---------------------------------------------------------------------------
 # Helper functions
@@ -528,6 +681,179 @@ class TestRunDeployHelpers:
         env = _load_env_file(str(tmp_path))
         assert env == {}
 
+    def test_load_env_file_rereads_after_change(self, tmp_path):
+        env_file = tmp_path / ".env"
+        env_file.write_text("KEY=one\n")
+        assert _load_env_file(str(tmp_path)) == {"KEY": "one"}
+
+        env_file.write_text("KEY=two\n")
+        st = env_file.stat()
+        os.utime(env_file, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+        assert _load_env_file(str(tmp_path)) == {"KEY": "two"}
+
+    def test_load_env_file_rereads_edit_with_same_mtime(self, tmp_path):
+        env_file = tmp_path / ".env"
+        env_file.write_text("KEY=one\n")
+        st = env_file.stat()
+        assert _load_env_file(str(tmp_path)) == {"KEY": "one"}
+
+        env_file.write_text("KEY=three\n")
+        os.utime(env_file, ns=(st.st_atime_ns, st.st_mtime_ns))
+        assert _load_env_file(str(tmp_path)) == {"KEY": "three"}
+
+    def test_load_env_file_returns_fresh_dict(self, tmp_path):
+        (tmp_path / ".env").write_text("KEY=val\n")
+        first = _load_env_file(str(tmp_path))
+        first["OTHER"] = "x"
+        assert _load_env_file(str(tmp_path)) == {"KEY": "val"}
+
+    def test_find_policy_quiet_prefers_dockcheck_dir(self, tmp_path):
+        (tmp_path / ".dockcheck").mkdir()
+        (tmp_path / ".dockcheck" / "policy.yaml").write_text("version: '1'\n")
+        (tmp_path / "policy.yaml").write_text("version: '1'\n")
+        found = _find_policy_quiet(None, tmp_path)
+        assert found == tmp_path / ".dockcheck" / "policy.yaml"
+
+    def test_find_policy_quiet_falls_back_to_bare_file(self, tmp_path):
+        (tmp_path / ".dockcheck").mkdir()
+        (tmp_path / "policy.yaml").write_text("version: '1'\n")
+        assert _find_policy_quiet(None, tmp_path) == tmp_path / "policy.yaml"
+
+    def test_find_policy_quiet_ignores_policy_directory(self, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        (tmp_path / ".dockcheck" / "policy.yaml").mkdir(parents=True)
+        (tmp_path / "policy.yaml").write_text("version: '1'\n")
+        assert _find_policy_quiet(None, tmp_path) == tmp_path / "policy.yaml"
+
+        (tmp_path / "policy.yaml").unlink()
+        (tmp_path / "policy.yaml").mkdir()
+        assert _find_policy_quiet(None, tmp_path) is None
+
+    def test_find_policy_quiet_missing(self, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        assert _find_policy_quiet(None, tmp_path) is None
+
+    @pytest.mark.parametrize("flag", [attr for attr, _ in _FLAG_TO_PROVIDER])
+    def test_detect_deploy_provider_matches_registry(self, flag):
+        from dockcheck.init.detect import RepoContext
+
+        # Every flag set on its own, and together with all later flags.
+        attrs = [attr for attr, _ in _FLAG_TO_PROVIDER]
+        for ctx in (
+            RepoContext(**{flag: True}),
+            RepoContext(**dict.fromkeys(attrs[attrs.index(flag):], True)),
+        ):
+            expected = _registry().detect(ctx)[0].name
+            assert _detect_deploy_provider(Path("."), ctx) == expected
+
+    def test_detect_deploy_provider_none(self):
+        from dockcheck.init.detect import RepoContext
+
+        assert _detect_deploy_provider(Path("."), RepoContext()) is None
+
     def test_run_deploy_unknown_provider(self):
         result = _run_deploy("nonexistent", "/tmp")
         assert result is False
+
+
+class TestDetectOnce:
+    def test_registry_and_preflight_are_shared(self):
+        assert _registry() is _registry()
+        assert _preflight() is _preflight()
+
+    def test_ship_rescans_only_after_auto_init(self, tmp_path):
+        from dockcheck.init.detect import RepoDetector
+
+        (tmp_path / "wrangler.toml").write_text('name = "test"')
+        (tmp_path / "package.json").write_text('{"name": "test"}')
+        (tmp_path / ".gitignore").write_text(".env\n")
+        real_detect = RepoDetector.detect
+        mock_deploy = MagicMock(success=True, url=None)
+
+        with (
+            patch("subprocess.run", return_value=_MOCK_SUBPROCESS_EMPTY),
+            patch("shutil.which", return_value="/usr/local/bin/wrangler"),
+            patch("os.environ.get", side_effect=_cf_env),
+            patch(
+                "dockcheck.tools.deploy.CloudflareProvider.deploy",
+                return_value=mock_deploy,
+            ),
+            patch.object(
+                RepoDetector, "detect", autospec=True, side_effect=real_detect
+            ) as spy,
+            patch("dockcheck.cli._run_pipeline") as mock_pipeline,
+        ):
+            args = [
+                "ship", "--dir", str(tmp_path), "--non-interactive",
+                "--skip-lint", "--skip-test",
+            ]
+            first = CliRunner().invoke(cli, args)
+            first_scans = spy.call_count
+            second = CliRunner().invoke(cli, args)
+
+        assert first.exit_code == 0, first.output
+        assert second.exit_code == 0, second.output
+        # Preflight scan plus a rescan after auto-init wrote the workflow.
+        assert first_scans == 2
+        assert mock_pipeline.call_args_list[0].kwargs["ctx"].has_github_workflows
+        # Already initialized: one scan for the whole command.
+        assert spy.call_count - first_scans == 1
+
+
+class TestRunCommand:
+    def test_simple_command_is_split(self):
+        assert _command_argv("ruff check . --fix") == ["ruff", "check", ".", "--fix"]
+
+    def test_quoted_arguments_are_preserved(self):
+        assert _command_argv('pytest -k "not slow"') == ["pytest", "-k", "not slow"]
+
+    @pytest.mark.parametrize(
+        "cmd",
+        [
+            "npm ci && npm test",
+            "ruff check . | tee out.txt",
+            "pytest tests/*.py",
+            "echo $HOME",
+            "CI=1 npm test",
+        ],
+    )
+    def test_shell_syntax_keeps_shell(self, cmd):
+        assert _command_argv(cmd) is None
+
+    def test_runs_without_shell_when_possible(self):
+        completed = subprocess.CompletedProcess(args=[], returncode=0)
+        with patch("subprocess.run", return_value=completed) as mock_run:
+            assert _run_command("ruff check .", cwd="/tmp") == 0
+        args, kwargs = mock_run.call_args
+        assert args[0] == ["ruff", "check", "."]
+        assert kwargs["shell"] is False
+
+    def test_runs_through_shell_for_pipelines(self):
+        completed = subprocess.CompletedProcess(args=[], returncode=3)
+        with patch("subprocess.run", return_value=completed) as mock_run:
+            assert _run_command("npm ci && npm test", cwd="/tmp") == 3
+        args, kwargs = mock_run.call_args
+        assert args[0] == "npm ci && npm test"
+        assert kwargs["shell"] is True
+
+    def test_windows_always_uses_shell(self):
+        completed = subprocess.CompletedProcess(args=[], returncode=0)
+        with (
+            patch("dockcheck.cli.os.name", "nt"),
+            patch("subprocess.run", return_value=completed) as mock_run,
+        ):
+            assert _run_command("npm test", cwd="/tmp") == 0
+            _capture_command("npx biome check .", cwd="/tmp")
+        for (args, kwargs), cmd in zip(
+            mock_run.call_args_list, ["npm test", "npx biome check ."]
+        ):
+            assert args[0] == cmd
+            assert kwargs["shell"] is True
+
+    def test_capture_returns_output(self, tmp_path):
+        rc, output = _capture_command("python -c \"print('hi')\"", cwd=str(tmp_path))
+        assert rc == 0
+        assert output.strip() == "hi"
+
+    def test_missing_binary_returns_127(self, tmp_path):
+        assert _run_command("dockcheck-no-such-binary --version", cwd=str(tmp_path)) == 127
@@ -9,6 +9,7 @@ from dockcheck.core.confidence import (
     ActionNeeded,
     AgentStepResult,
     ConfidenceScorer,
+    Finding,
 )
 
 FIXTURES = Path(__file__).parent.parent / "fixtures" / "mock_agent_responses"
@@ -120,6 +121,14 @@ class TestConfidenceScorer:
         score = scorer.score(results)
         assert score.score == pytest.approx(0.5, abs=0.01)
 
+    def test_weights_are_read_only_copy(self):
+        weights = {"analyze": 0.5}
+        scorer = ConfidenceScorer(weights=weights)
+        weights["analyze"] = 0.0
+        assert scorer.weights["analyze"] == 0.5
+        with pytest.raises(TypeError):
+            scorer.weights["test"] = 1.0  # type: ignore[index]
+
     def test_unknown_step_gets_default_weight(self, scorer):
         results = [
             AgentStepResult(step="custom_step", completed=True, confidence=0.8),
@@ -151,3 +160,50 @@ class TestConfidenceScorer:
         ]
         score = scorer.score(results)
         assert score.score >= 0.0
+
+    def test_severity_flags_across_results(self, scorer):
+        results = [
+            AgentStepResult(
+                step="analyze", completed=True, confidence=0.9,
+                findings=[Finding(severity="warning", message="w")],
+            ),
+            AgentStepResult(
+                step="test", completed=True, confidence=0.9,
+                findings=[
+                    Finding(severity="info", message="i"),
+                    Finding(severity="error", message="e"),
+                ],
+            ),
+        ]
+        score = scorer.score(results)
+        assert score.has_errors is True
+        assert score.has_critical is False
+
+    def test_unknown_severity_is_ignored(self, scorer):
+        results = [
+            AgentStepResult(
+                step="analyze", completed=True, confidence=0.9,
+                findings=[Finding(severity="CRITICAL", message="wrong case")],
+            ),
+        ]
+        score = scorer.score(results)
+        assert score.has_critical is False
+        assert score.has_errors is False
+
+    def test_critical_keeps_full_step_bookkeeping(self, scorer):
+        results = [
+            AgentStepResult(
+                step="security", completed=True, confidence=0.9,
+                findings=[
+                    Finding(severity="critical", message="c"),
+                    Finding(severity="error", message="e"),
+                ],
+            ),
+            AgentStepResult(step="test", completed=False, confidence=0.5),
+        ]
+        score = scorer.score(results)
+        assert score.score == 0.0
+        assert score.has_critical is True
+        assert score.has_errors is True
+        assert score.step_scores == {"security": 0.9, "test": 0.5}
+        assert score.incomplete_steps == ["test"]
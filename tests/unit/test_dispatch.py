@@ -5,15 +5,22 @@ from __future__ import annotations
 
 import asyncio
 import json
+import os
+import subprocess
+import sys
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
+from pydantic import ValidationError
 
 from dockcheck.agents.dispatch import (
     AgentDispatcher,
     DispatchError,
+    _fast_build_result,
     _parse_claude_output,
     _parse_codex_output,
+    _resolve_binary,
+    run_event_loop,
 )
 from dockcheck.agents.schemas import AgentResult
 
@@ -21,23 +28,47 @@ from dockcheck.agents.schemas import AgentResult
 # Helpers
 # ---------------------------------------------------------------------------
 
+@pytest.fixture(autouse=True)
+def _fake_path():
+    """Resolve every agent CLI to ``/usr/bin/<name>`` without touching PATH."""
+    _resolve_binary.cache_clear()
+    with patch("shutil.which", side_effect=lambda name: f"/usr/bin/{name}"):
+        yield
+    _resolve_binary.cache_clear()
+
+
+def _stream(data: bytes) -> asyncio.StreamReader:
+    reader = asyncio.StreamReader()
+    reader.feed_data(data)
+    reader.feed_eof()
+    return reader
+
+
 def _make_proc(
     returncode: int = 0,
     stdout: bytes = b"",
     stderr: bytes = b"",
-    timeout: bool = False,
 ) -> MagicMock:
-    """Build a mock asyncio.subprocess.Process."""
+    """Build a mock asyncio.subprocess.Process with pre-filled pipes."""
     proc = MagicMock()
     proc.returncode = returncode
-    if timeout:
-        proc.communicate = AsyncMock(side_effect=asyncio.TimeoutError)
-    else:
-        proc.communicate = AsyncMock(return_value=(stdout, stderr))
+    proc.stdout = _stream(stdout)
+    proc.stderr = _stream(stderr)
+    proc.wait = AsyncMock(return_value=returncode)
     proc.kill = MagicMock()
     return proc
 
 
+def _raising_wait_for(exc: type[BaseException]):
+    """Stand-in for ``asyncio.wait_for`` that closes the awaitable, then raises."""
+
+    async def wait_for(aw, timeout=None):
+        aw.close()
+        raise exc
+
+    return wait_for
+
+
 def _good_result_bytes(**kwargs) -> bytes:
     data = {
         "completed": True,
@@ -108,6 +139,13 @@ class TestParseClaudeOutput:
         assert result.summary == "fenced"
         assert result.confidence == 0.7
 
+    def test_code_fence_with_trailing_prose_or_no_closer(self):
+        inner = json.dumps({"completed": True, "confidence": 0.6, "summary": "x"})
+        for fenced in (f"```json\n{inner}\n```\nHope this helps!", f"```\n{inner}"):
+            envelope = json.dumps({"type": "result", "result": fenced})
+            result = _parse_claude_output(envelope)
+            assert result.confidence == 0.6
+
     def test_invalid_json_falls_back_to_plain(self):
         result = _parse_claude_output("{not valid json")
         assert result.completed is True
@@ -133,6 +171,55 @@ class TestParseClaudeOutput:
         result = _parse_claude_output("", stderr="something went wrong")
         assert "something went wrong" in result.summary
 
+    def test_inner_json_without_completed_key_is_not_parsed(self):
+        envelope = json.dumps({"type": "result", "result": '{"note": "hi"}'})
+        with patch("dockcheck.agents.dispatch.json.loads", wraps=json.loads) as loads:
+            result = _parse_claude_output(envelope)
+        assert loads.call_count == 1  # outer envelope only
+        assert result.summary == '{"note": "hi"}'
+
+    def test_accepts_raw_bytes(self):
+        result = _parse_claude_output(_good_result_bytes(summary="bytes in"))
+        assert result.summary == "bytes in"
+
+    def test_invalid_utf8_bytes_fall_back_to_text(self):
+        result = _parse_claude_output(b"not json \xff\xfe")
+        assert result.completed is True
+        assert result.summary.startswith("not json")
+
+
+class TestFastBuildResult:
+    def test_matches_model_validate_for_well_formed_input(self):
+        data = {
+            "completed": True,
+            "confidence": 1,
+            "turns_used": 2,
+            "summary": "ok",
+            "findings": [
+                {"severity": "error", "message": "boom", "file_path": "a.py", "line": 3},
+                {"severity": "info", "message": "fyi"},
+            ],
+            "action_needed": "retry",
+        }
+        assert _fast_build_result(data) == AgentResult.model_validate(data)
+
+    def test_out_of_range_confidence_still_rejected(self):
+        with pytest.raises(ValidationError):
+            _fast_build_result({"completed": True, "confidence": 1.5})
+
+    def test_unknown_severity_still_rejected(self):
+        data = {
+            "completed": True,
+            "confidence": 0.5,
+            "findings": [{"severity": "fatal", "message": "x"}],
+        }
+        with pytest.raises(ValidationError):
+            _fast_build_result(data)
+
+    def test_coercible_input_falls_back_to_validation(self):
+        result = _fast_build_result({"completed": True, "confidence": "0.4"})
+        assert result.confidence == 0.4
+
 
 class TestParseCodexOutput:
     def test_empty_string_returns_incomplete(self):
@@ -155,6 +242,10 @@ class TestParseCodexOutput:
         result = _parse_codex_output("", stderr="codex error")
         assert "codex error" in result.summary
 
+    def test_plain_bytes_fallback_decoded(self):
+        result = _parse_codex_output(b"Done.\n")
+        assert result.summary == "Done."
+
 
 # ---------------------------------------------------------------------------
 # AgentDispatcher — subprocess interaction (mocked)
@@ -179,7 +270,7 @@ class TestAgentDispatcherClaude:
 
         # Verify CLI arguments.
         call_args = list(mock_exec.call_args[0])
-        assert call_args[0] == "claude"
+        assert call_args[0] == "/usr/bin/claude"
         assert "--print" in call_args
         assert "--output-format" in call_args
         idx = call_args.index("--output-format")
@@ -204,18 +295,55 @@ class TestAgentDispatcherClaude:
     @pytest.mark.asyncio
     async def test_dispatch_claude_timeout(self, dispatcher):
         # Patch wait_for to raise TimeoutError.
-        # proc.communicate is called AFTER kill() in the except block —
+        # proc.wait is awaited AFTER kill() in the except block —
         # it must return cleanly to allow the DispatchError to propagate.
         proc = MagicMock()
         proc.returncode = -9
         proc.kill = MagicMock()
-        proc.communicate = AsyncMock(return_value=(b"", b""))
+        proc.wait = AsyncMock(return_value=-9)
+
+        with patch("asyncio.create_subprocess_exec", return_value=proc):
+            with patch("asyncio.wait_for", _raising_wait_for(asyncio.TimeoutError)):
+                with pytest.raises(DispatchError, match="timed out"):
+                    await dispatcher.dispatch_claude("run", timeout=1)
+
+        proc.kill.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_timeout_after_process_exited_still_reports_timeout(self, dispatcher):
+        proc = MagicMock()
+        proc.kill = MagicMock(side_effect=ProcessLookupError)
+        proc.wait = AsyncMock(return_value=0)
 
         with patch("asyncio.create_subprocess_exec", return_value=proc):
-            with patch("asyncio.wait_for", side_effect=asyncio.TimeoutError):
+            with patch("asyncio.wait_for", _raising_wait_for(asyncio.TimeoutError)):
                 with pytest.raises(DispatchError, match="timed out"):
                     await dispatcher.dispatch_claude("run", timeout=1)
 
+        proc.wait.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_dispatch_claude_output_too_large(self, dispatcher):
+        proc = _make_proc(returncode=0, stdout=b"x" * 4096)
+
+        with patch("dockcheck.agents.dispatch.MAX_STDOUT_BYTES", 1024):
+            with patch("asyncio.create_subprocess_exec", return_value=proc):
+                with pytest.raises(DispatchError, match="exceeded 1024 bytes"):
+                    await dispatcher.dispatch_claude("run")
+
+        proc.kill.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_cancelled_dispatch_kills_process(self, dispatcher):
+        proc = MagicMock()
+        proc.kill = MagicMock()
+        proc.wait = AsyncMock(return_value=-9)
+
+        with patch("asyncio.create_subprocess_exec", return_value=proc):
+            with patch("asyncio.wait_for", _raising_wait_for(asyncio.CancelledError)):
+                with pytest.raises(asyncio.CancelledError):
+                    await dispatcher.dispatch_claude("run")
+
         proc.kill.assert_called_once()
 
     @pytest.mark.asyncio
@@ -238,13 +366,37 @@ class TestAgentDispatcherClaude:
         assert result.summary == "partial result"
 
     @pytest.mark.asyncio
-    async def test_dispatch_claude_not_found(self, dispatcher):
+    async def test_dispatch_claude_binary_vanished_after_resolve(self, dispatcher):
         with patch(
             "asyncio.create_subprocess_exec",
             side_effect=FileNotFoundError("claude not found"),
         ):
-            with pytest.raises(DispatchError, match="not found"):
-                await dispatcher.dispatch_claude("run")
+            with patch.object(
+                _resolve_binary, "cache_clear", wraps=_resolve_binary.cache_clear
+            ) as mock_clear:
+                with pytest.raises(DispatchError, match="claude CLI not found"):
+                    await dispatcher.dispatch_claude("run")
+        mock_clear.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_dispatch_claude_missing_from_path(self, dispatcher):
+        _resolve_binary.cache_clear()
+        with patch("shutil.which", return_value=None):
+            with patch("asyncio.create_subprocess_exec") as mock_exec:
+                with pytest.raises(DispatchError, match="claude CLI not found"):
+                    await dispatcher.dispatch_claude("run")
+        mock_exec.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_binary_path_resolved_once(self, dispatcher):
+        _resolve_binary.cache_clear()
+        with patch("shutil.which", return_value="/opt/claude") as mock_which:
+            for _ in range(3):
+                proc = _make_proc(returncode=0, stdout=_good_result_bytes())
+                with patch("asyncio.create_subprocess_exec", return_value=proc) as mock_exec:
+                    await dispatcher.dispatch_claude("run")
+                assert mock_exec.call_args[0][0] == "/opt/claude"
+        mock_which.assert_called_once_with("claude")
 
 
 class TestAgentDispatcherCodex:
@@ -264,7 +416,7 @@ class TestAgentDispatcherCodex:
         assert result.summary == "codex finished"
 
         call_args = list(mock_exec.call_args[0])
-        assert call_args[0] == "codex"
+        assert call_args[0] == "/usr/bin/codex"
         assert "--quiet" in call_args
         assert "--approval-mode" in call_args
         idx = call_args.index("--approval-mode")
@@ -286,11 +438,9 @@ class TestAgentDispatcherCodex:
     async def test_dispatch_codex_timeout(self, dispatcher):
         with patch("asyncio.create_subprocess_exec") as mock_exec:
             proc = _make_proc(returncode=0)
-            proc.kill = MagicMock()
-            proc.communicate = AsyncMock(return_value=(b"", b""))
             mock_exec.return_value = proc
 
-            with patch("asyncio.wait_for", side_effect=asyncio.TimeoutError):
+            with patch("asyncio.wait_for", _raising_wait_for(asyncio.TimeoutError)):
                 with pytest.raises(DispatchError, match="timed out"):
                     await dispatcher.dispatch_codex("run", timeout=1)
 
@@ -399,3 +549,78 @@ class TestAgentDispatcherParallel:
 
         await dispatcher.dispatch_parallel([{"prompt": "no agent specified"}])
         assert calls == ["claude"]
+
+    @pytest.mark.asyncio
+    async def test_dispatch_parallel_does_not_mutate_tasks(self, dispatcher):
+        seen_kwargs = []
+
+        async def fake_dispatch(agent, prompt, **kwargs):
+            seen_kwargs.append(kwargs)
+            return AgentResult(completed=True, confidence=0.8, summary=prompt)
+
+        dispatcher.dispatch = fake_dispatch  # type: ignore[method-assign]
+
+        task = {"agent": "codex", "prompt": "p", "timeout": 5}
+        await dispatcher.dispatch_parallel([task])
+        assert task == {"agent": "codex", "prompt": "p", "timeout": 5}
+        assert seen_kwargs == [{"timeout": 5}]
+
+    @pytest.mark.asyncio
+    async def test_dispatch_parallel_bounds_concurrency(self, dispatcher):
+        in_flight = 0
+        peak = 0
+
+        async def fake_dispatch(agent, prompt, **kwargs):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0)
+            in_flight -= 1
+            return AgentResult(completed=True, confidence=0.8, summary=prompt)
+
+        dispatcher.dispatch = fake_dispatch  # type: ignore[method-assign]
+
+        tasks = [{"prompt": str(i)} for i in range(10)]
+        results = await dispatcher.dispatch_parallel(tasks, max_concurrent=3)
+        assert len(results) == 10
+        assert peak == 3
+
+
+async def _answer() -> int:
+    return 42
+
+
+class TestRunEventLoop:
+    def test_disabled_by_default(self, monkeypatch):
+        fake_uvloop = MagicMock()
+        monkeypatch.delenv("DOCKCHECK_UVLOOP", raising=False)
+        monkeypatch.setitem(sys.modules, "uvloop", fake_uvloop)
+        assert run_event_loop(_answer()) == 42
+        fake_uvloop.run.assert_not_called()
+
+    def test_missing_uvloop_is_ignored(self, monkeypatch):
+        monkeypatch.setenv("DOCKCHECK_UVLOOP", "1")
+        monkeypatch.setitem(sys.modules, "uvloop", None)
+        assert run_event_loop(_answer()) == 42
+
+    def test_uses_uvloop_run_when_enabled(self, monkeypatch):
+        fake_uvloop = MagicMock()
+        fake_uvloop.run.side_effect = asyncio.run
+        monkeypatch.setenv("DOCKCHECK_UVLOOP", "1")
+        monkeypatch.setitem(sys.modules, "uvloop", fake_uvloop)
+        with patch("asyncio.set_event_loop_policy") as mock_set:
+            assert run_event_loop(_answer()) == 42
+        fake_uvloop.run.assert_called_once()
+        mock_set.assert_not_called()
+
+    def test_import_leaves_policy_alone(self):
+        # Fresh interpreter so the import really runs.
+        code = (
+            "import asyncio, sys, types\n"
+            "sys.modules['uvloop'] = types.SimpleNamespace(EventLoopPolicy=object)\n"
+            "before = asyncio.get_event_loop_policy()\n"
+            "import dockcheck.agents.dispatch, dockcheck.agents.parallel\n"
+            "assert asyncio.get_event_loop_policy() is before\n"
+        )
+        env = {**os.environ, "DOCKCHECK_UVLOOP": "1"}
+        subprocess.run([sys.executable, "-c", code], env=env, check=True)
@@ -223,3 +223,18 @@ class TestDiffAnalyzer:
         )
         diff = diff_path.read_text()
         assert DiffAnalyzer.count_file_deletes(diff) == 2
+
+    @pytest.mark.parametrize(
+        "name", ["safe_change.diff", "dangerous_change.diff", "file_delete.diff"]
+    )
+    def test_scan_stream_matches_string_helpers(self, name):
+        diff_path = Path(__file__).parent.parent / "fixtures" / "sample_diffs" / name
+        diff = diff_path.read_text()
+        with diff_path.open() as f:
+            paths, deletes = DiffAnalyzer.scan_stream(f)
+        assert paths == DiffAnalyzer.extract_file_paths(diff)
+        assert deletes == DiffAnalyzer.count_file_deletes(diff)
+
+    def test_scan_stream_dedupes_paths(self):
+        lines = ["--- a/app.py\n", "+++ b/app.py\n", "--- a/lib.py\n", "+++ /dev/null\n"]
+        assert DiffAnalyzer.scan_stream(lines) == (["app.py", "lib.py"], 1)
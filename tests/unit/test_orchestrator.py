@@ -3,6 +3,7 @@ behaviour, parallel group execution, and policy integration."""
 
 from __future__ import annotations
 
+import asyncio
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
@@ -154,6 +155,23 @@ class TestAgentResultToStepResult:
         sr = _agent_result_to_step_result("x", r)
         assert sr.action_needed == ActionNeeded.NONE
 
+    def test_matches_validated_construction(self):
+        from dockcheck.core.confidence import AgentStepResult
+
+        r = AgentResult(
+            completed=True,
+            confidence=0.7,
+            turns_used=2,
+            summary="done",
+            findings=[
+                Finding(severity=FindingSeverity.ERROR, message="m", file_path="a.py", line=3),
+            ],
+            action_needed="retry",
+        )
+        sr = _agent_result_to_step_result("lint", r)
+        assert sr == AgentStepResult.model_validate(sr.model_dump())
+        assert sr.findings[0].file_path == "a.py"
+
 
 # ---------------------------------------------------------------------------
 # Dependency resolution (_resolve_dependencies)
@@ -227,6 +245,53 @@ class TestResolveDependencies:
         layers = orch._resolve_dependencies([])
         assert layers == []
 
+    def test_layers_keep_pipeline_order(self, engine):
+        orch = Orchestrator(policy_engine=engine, notifier=NullNotifier())
+        steps = [
+            StepConfig(name="z", skill="z", depends_on=["a"]),
+            StepConfig(name="a", skill="a"),
+            StepConfig(name="m", skill="m", depends_on=["a", "a"]),
+            StepConfig(name="b", skill="b"),
+        ]
+        layers = orch._resolve_dependencies(steps)
+        assert [[s.name for s in layer] for layer in layers] == [["a", "b"], ["z", "m"]]
+
+    def test_cycle_reports_blocked_steps(self, engine):
+        orch = Orchestrator(policy_engine=engine, notifier=NullNotifier())
+        steps = [
+            StepConfig(name="a", skill="a"),
+            StepConfig(name="b", skill="b", depends_on=["c"]),
+            StepConfig(name="c", skill="c", depends_on=["b"]),
+            StepConfig(name="d", skill="d", depends_on=["c"]),
+        ]
+        with pytest.raises(ValueError, match=r"\['b', 'c', 'd'\]"):
+            orch._resolve_dependencies(steps)
+
+    def test_layers_cached_per_pipeline_shape(self, engine, monkeypatch):
+        orch = Orchestrator(policy_engine=engine, notifier=NullNotifier())
+        calls = []
+        original = Orchestrator._layer_indices
+        monkeypatch.setattr(
+            Orchestrator, "_layer_indices",
+            staticmethod(lambda steps: calls.append(1) or original(steps)),
+        )
+        first = [
+            StepConfig(name="a", skill="a"),
+            StepConfig(name="b", skill="b", depends_on=["a"]),
+        ]
+        second = [
+            StepConfig(name="a", skill="x"),
+            StepConfig(name="b", skill="y", depends_on=["a"]),
+        ]
+
+        orch._resolve_dependencies(first)
+        layers = orch._resolve_dependencies(second)
+
+        assert len(calls) == 1
+        assert layers[1][0] is second[1]
+        orch._resolve_dependencies([StepConfig(name="a", skill="a")])
+        assert len(calls) == 2
+
 
 # ---------------------------------------------------------------------------
 # Parallel group helper
@@ -374,6 +439,22 @@ class TestRunPipeline:
         assert "analyze" in result.step_results
         assert "test" in result.step_results
 
+    @pytest.mark.asyncio
+    async def test_each_step_result_converted_once(self, monkeypatch):
+        import dockcheck.core.orchestrator as orchestrator_mod
+
+        calls: list[str] = []
+        original = orchestrator_mod._agent_result_to_step_result
+        monkeypatch.setattr(
+            orchestrator_mod,
+            "_agent_result_to_step_result",
+            lambda name, r: calls.append(name) or original(name, r),
+        )
+        orch = _make_orchestrator(_good_result(), _escalate_result())
+        result = await orch.run_pipeline(_simple_pipeline("analyze", "test"))
+        assert result.blocked is True
+        assert calls == ["analyze", "test"]
+
     @pytest.mark.asyncio
     async def test_step_results_keyed_by_name(self):
         orch = _make_orchestrator(
@@ -406,6 +487,34 @@ class TestRunPipeline:
         # dispatch should NOT have been called since policy pre-check blocks it.
         dispatcher.dispatch.assert_not_awaited()
 
+    @pytest.mark.asyncio
+    async def test_policy_without_hard_stops_is_not_evaluated(self, monkeypatch):
+        engine = PolicyEngine(Policy())
+        monkeypatch.setattr(engine, "evaluate", MagicMock())
+        orch = Orchestrator(
+            policy_engine=engine,
+            dispatcher=_make_dispatcher(_good_result()),
+            notifier=NullNotifier(),
+        )
+        result = await orch.run_pipeline(
+            _simple_pipeline("analyze"), context={"commands": ["rm -rf /var/data"]}
+        )
+        assert result.success is True
+        engine.evaluate.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_policy_evaluated_once_per_run(self, monkeypatch):
+        engine = _make_policy()
+        monkeypatch.setattr(engine, "evaluate", MagicMock(wraps=engine.evaluate))
+        orch = _make_orchestrator(
+            _good_result(), _good_result(), _good_result(), policy=engine
+        )
+        result = await orch.run_pipeline(
+            _simple_pipeline("a", "b", "c"), context={"commands": ["ls -la"]}
+        )
+        assert len(result.step_results) == 3
+        engine.evaluate.assert_called_once()
+
     @pytest.mark.asyncio
     async def test_empty_pipeline_succeeds_with_zero_confidence(self):
         orch = _make_orchestrator()
@@ -591,6 +700,37 @@ class TestParallelGroupExecution:
         result = await orch.run_pipeline(pipeline)
         assert result.blocked is True
 
+    @pytest.mark.asyncio
+    async def test_escalation_cancels_running_siblings(self):
+        engine = _make_policy()
+        cancelled: list[str] = []
+
+        async def fake_dispatch(agent, prompt, **kwargs):
+            if "'security'" in prompt:
+                return _escalate_result()
+            try:
+                await asyncio.sleep(30)
+            except asyncio.CancelledError:
+                cancelled.append("slow")
+                raise
+            return _good_result()
+
+        dispatcher = AgentDispatcher()
+        dispatcher.dispatch = fake_dispatch  # type: ignore[method-assign]
+        pipeline = PipelineConfig(
+            steps=[
+                StepConfig(name="slow", skill="slow", parallel_group="g1"),
+                StepConfig(name="security", skill="security", parallel_group="g1"),
+            ]
+        )
+        orch = Orchestrator(policy_engine=engine, dispatcher=dispatcher, notifier=NullNotifier())
+
+        result = await asyncio.wait_for(orch.run_pipeline(pipeline), timeout=5)
+
+        assert result.blocked is True
+        assert cancelled == ["slow"]
+        assert list(result.step_results) == ["security"]
+
 
 # ---------------------------------------------------------------------------
 # Notifier integration
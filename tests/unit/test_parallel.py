@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 from unittest.mock import MagicMock
 
 import pytest
@@ -15,6 +16,8 @@ from dockcheck.agents.parallel import (
     RunMetrics,
     TurnTracker,
 )
+from dockcheck.agents.schemas import AgentResult
+from dockcheck.agents.schemas import Finding as AgentFinding
 from dockcheck.core.confidence import AgentStepResult
 
 
@@ -72,6 +75,16 @@ class TestTurnTracker:
         tracker = TurnTracker()
         assert tracker.get_stats() == {}
 
+    def test_running_stats_match_history(self):
+        tracker = TurnTracker()
+        for val in [6, 2, 9, 4, 9, 1]:
+            tracker.record("test", val)
+        stats = tracker.get_stats()["test"]
+        history = tracker.get_history("test")
+        assert stats["min_turns"] == min(history) == 1
+        assert stats["max_turns"] == max(history) == 9
+        assert stats["avg_turns"] == round(sum(history) / len(history), 1)
+
 
 class TestMetricsCollector:
     def test_empty_summary(self):
@@ -196,6 +209,85 @@ class TestParallelDispatcher:
         assert result.all_completed is False
         assert "t1" in result.failed_tasks
 
+    @pytest.mark.asyncio
+    async def test_fan_out_fail_fast_raises_and_cancels(self):
+        dispatcher = MagicMock()
+        cancelled = []
+
+        async def dispatch(**kwargs):
+            if kwargs["prompt"] == "boom":
+                raise RuntimeError("auth failed")
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.append(kwargs["prompt"])
+                raise
+
+        dispatcher.dispatch = dispatch
+        parallel = ParallelDispatcher(dispatcher=dispatcher)
+        tasks = [
+            ParallelTask(task_id="slow", agent="claude", prompt="slow"),
+            ParallelTask(task_id="bad", agent="claude", prompt="boom"),
+        ]
+        with pytest.raises(RuntimeError, match="auth failed"):
+            await parallel.fan_out(tasks, fail_fast=True)
+        assert cancelled == ["slow"]
+
+    @pytest.mark.asyncio
+    async def test_fan_out_fail_fast_cancelled_caller_cancels_tasks(self):
+        dispatcher = MagicMock()
+        started = asyncio.Event()
+        cancelled = []
+
+        async def dispatch(**kwargs):
+            started.set()
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.append(kwargs["prompt"])
+                raise
+
+        dispatcher.dispatch = dispatch
+        parallel = ParallelDispatcher(dispatcher=dispatcher)
+        tasks = [ParallelTask(task_id=f"t{i}", prompt=f"p{i}") for i in range(2)]
+        outer = asyncio.ensure_future(parallel.fan_out(tasks, fail_fast=True))
+        await started.wait()
+        outer.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await outer
+        assert sorted(cancelled) == ["p0", "p1"]
+
+    @pytest.mark.asyncio
+    async def test_fan_out_fail_fast_success(self, mock_dispatcher):
+        parallel = ParallelDispatcher(dispatcher=mock_dispatcher)
+        tasks = [ParallelTask(task_id=f"t{i}", prompt="p") for i in range(3)]
+        result = await parallel.fan_out(tasks, fail_fast=True)
+        assert [r.task_id for r in result.results] == ["t0", "t1", "t2"]
+        assert result.all_completed is True
+
+    @pytest.mark.asyncio
+    async def test_fan_out_keeps_finding_location(self):
+        dispatcher = MagicMock()
+
+        async def dispatch(**kwargs):
+            return AgentResult(
+                completed=True,
+                confidence=0.7,
+                findings=[
+                    AgentFinding(
+                        severity="error", message="bad", file_path="app.py", line=12
+                    )
+                ],
+            )
+
+        dispatcher.dispatch = dispatch
+        parallel = ParallelDispatcher(dispatcher=dispatcher)
+        result = await parallel.fan_out([ParallelTask(task_id="t", prompt="p")])
+        finding = result.results[0].result.findings[0]
+        assert finding.severity == "error"
+        assert type(finding.severity) is str
+        assert (finding.file_path, finding.line) == ("app.py", 12)
+
     @pytest.mark.asyncio
     async def test_fan_out_concurrency_limit(self, mock_dispatcher):
         parallel = ParallelDispatcher(dispatcher=mock_dispatcher)
@@ -207,6 +299,27 @@ class TestParallelDispatcher:
         assert len(result.results) == 10
         assert result.all_completed is True
 
+    @pytest.mark.asyncio
+    async def test_fan_out_peak_concurrency_and_order(self):
+        dispatcher = MagicMock()
+        in_flight = 0
+        peak = 0
+
+        async def dispatch(**kwargs):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.001 * (int(kwargs["prompt"]) % 3))
+            in_flight -= 1
+            return AgentResult(completed=True, confidence=0.9)
+
+        dispatcher.dispatch = dispatch
+        parallel = ParallelDispatcher(dispatcher=dispatcher)
+        tasks = [ParallelTask(task_id=f"t{i}", prompt=str(i)) for i in range(12)]
+        result = await parallel.fan_out(tasks, max_concurrent=4)
+        assert peak == 4
+        assert [r.task_id for r in result.results] == [f"t{i}" for i in range(12)]
+
     @pytest.mark.asyncio
     async def test_fan_out_services(self, mock_dispatcher):
         parallel = ParallelDispatcher(dispatcher=mock_dispatcher)
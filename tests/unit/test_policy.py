@@ -1,6 +1,7 @@
 """Tests for policy engine — parsing, evaluation, and threshold logic."""
 
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 
@@ -56,6 +57,21 @@ class TestPolicyParsing:
         assert breakers.max_deploys_per_hour == 3
         assert breakers.max_file_deletes_per_turn == 10
 
+    def test_yaml_loader_matches_safe_load(self):
+        import yaml
+
+        path = FIXTURES / "sample_policy.yaml"
+        expected = Policy.from_dict(yaml.safe_load(path.read_text()))
+        assert Policy.from_yaml(path) == expected
+
+    def test_yaml_loader_rejects_python_tags(self, tmp_path):
+        import yaml
+
+        path = tmp_path / "policy.yaml"
+        path.write_text("version: !!python/object/apply:os.getcwd []\n")
+        with pytest.raises(yaml.YAMLError):
+            Policy.from_yaml(path)
+
 
 class TestPolicyEvaluation:
     @pytest.fixture()
@@ -146,6 +162,85 @@ class TestPolicyEvaluation:
         assert len(result.blocked_paths) == 1
 
 
+class TestCommandPatterns:
+    def test_each_matching_pattern_is_reported(self):
+        engine = PolicyEngine(Policy.from_dict({
+            "hard_stops": {"commands": [{"pattern": "rm -rf"}, {"pattern": "rm"}]},
+        }))
+        result = engine.evaluate(commands=["rm -rf /tmp/x"])
+        assert result.blocked_commands == ["rm -rf /tmp/x", "rm -rf /tmp/x"]
+        assert len(result.reasons) == 2
+
+    def test_patterns_are_literal(self):
+        engine = PolicyEngine(Policy.from_dict({
+            "hard_stops": {"commands": [{"pattern": "a.b(c)"}]},
+        }))
+        assert engine.evaluate(commands=["axb(c)"]).verdict == Verdict.PASS
+        assert engine.evaluate(commands=["run a.b(c)"]).verdict == Verdict.BLOCK
+
+    def test_no_patterns_never_blocks(self):
+        engine = PolicyEngine(Policy())
+        assert engine.evaluate(commands=["rm -rf /"]).verdict == Verdict.PASS
+
+    def test_has_hard_stops(self):
+        assert PolicyEngine(Policy()).has_hard_stops is False
+        assert PolicyEngine(Policy.from_dict({
+            "hard_stops": {"critical_paths": ["*.pem"]},
+        })).has_hard_stops is True
+
+
+class TestCriticalPathPrefilter:
+    GLOBS = ["**/production/**", "**/.env*", "**/secrets/**", "infra/*.tf", "*.pem"]
+    PATHS = [
+        "src/app.py",
+        ".env",
+        "config/.env.local",
+        "deploy/production/main.tf",
+        "production/db.yaml",
+        "a\\b\\secrets\\key.txt",
+        "infra/main.tf",
+        "infra/modules/vpc.tf",
+        "certs/server.pem",
+        "README.md",
+        "docs/secrets.md",
+    ]
+
+    def test_matches_per_glob_checks(self):
+        engine = PolicyEngine(Policy.from_dict({
+            "hard_stops": {"critical_paths": self.GLOBS},
+        }))
+        result = engine.evaluate(file_paths=self.PATHS)
+        expected = [
+            path
+            for path in self.PATHS
+            for glob in self.GLOBS
+            if PolicyEngine._matches_glob(path, glob)
+        ]
+        assert result.blocked_paths == expected
+        assert "src/app.py" not in result.blocked_paths
+
+    def test_no_globs_never_blocks(self):
+        engine = PolicyEngine(Policy())
+        assert engine.evaluate(file_paths=[".env"]).verdict == Verdict.PASS
+
+    @pytest.mark.parametrize("glob", GLOBS + ["**/*.key", "**/a\\b", "**"])
+    def test_compiled_glob_agrees_with_matches_glob(self, glob):
+        engine = PolicyEngine(Policy.from_dict({"hard_stops": {"critical_paths": [glob]}}))
+        paths = self.PATHS + ["x/a\\b", "a\\b", "k.key", "deep/er/k.key", ""]
+        for path in paths:
+            expected = [glob] if PolicyEngine._matches_glob(path, glob) else []
+            assert engine._matching_globs(path) == expected, path
+
+    def test_case_folding_platform_falls_back(self):
+        with patch("os.path.normcase", side_effect=lambda p: p.lower()):
+            engine = PolicyEngine(Policy.from_dict({
+                "hard_stops": {"critical_paths": self.GLOBS},
+            }))
+            result = engine.evaluate(file_paths=["deploy/production/main.tf"])
+        assert engine._path_regex is None
+        assert result.verdict == Verdict.BLOCK
+
+
 class TestConfidenceThresholds:
     @pytest.fixture()
     def engine(self):